@@ -31,6 +31,31 @@ from .savegame import Savegame, Equipped, Equipment, Inventory, Egg, EggDoor, Bu
         has_image_support
 
 
+# Flame-related args, and the state to set the chosen flames to
+FLAME_ACTIONS = (
+        ('flame_collect', FlameState.COLLECTED),
+        ('flame_use', FlameState.USED),
+        )
+
+# Args which use EnumSetAction (by their `dest`).  These get frozen once
+# we're done massaging them after parsing; any new EnumSetAction args should
+# be added here too.
+ENUM_SET_ARGS = (
+        'globals_enable', 'globals_disable',
+        'equip_enable', 'equip_disable',
+        'inventory_enable', 'inventory_disable',
+        'map_enable',
+        'progress_enable', 'progress_disable',
+        'cats_free', 'cats_cage',
+        'teleport_enable', 'teleport_disable',
+        'quest_state_enable', 'quest_state_disable',
+        'egg_enable', 'egg_disable',
+        'bunny_enable', 'bunny_disable',
+        'eggdoor_open', 'eggdoor_close',
+        'candles_enable', 'candles_disable',
+        )
+
+
 class EnumSetAction(argparse.Action):
     """
     Argparse Action to set Enum members as the arg `choices`, adding them
@@ -166,6 +191,17 @@ def delete_common_set_items(set1, set2):
     set2 -= common
 
 
+def pick_flames(slot, arg):
+    """
+    Given a `slot` and the value of one of our flame args, return the list
+    of flames which the user has chosen (which might just be all of them).
+    """
+    if 'all' in arg:
+        return slot.flames
+    else:
+        return [slot.flames[letter] for letter in arg]
+
+
 def check_file_overwrite(args, filename):
     """
     Checks to see if a file that we intend to write to exists.  If the --force
@@ -187,6 +223,22 @@ def check_file_overwrite(args, filename):
     return do_write
 
 
+def export_slot_data(args, slot, label_prefix):
+    """
+    Exports the data from `slot` into the filename given by `--export-slot`,
+    if that option was specified.  `label_prefix` is used to prefix our
+    status output.
+    """
+    if args.export_slot:
+        print(f'{label_prefix}Exporting slot data to: {args.export_slot}')
+        if check_file_overwrite(args, args.export_slot):
+            with open(args.export_slot, 'wb') as df:
+                df.write(slot.export_data())
+            print('Slot data exported!')
+        else:
+            print('NOTICE: Slot data NOT exported')
+
+
 def column_chunks(l, columns):
     """
     Divide up a given list `l` into the specified number of
@@ -1172,6 +1224,13 @@ def main():
     delete_common_set_items(args.inventory_enable, args.inventory_disable)
     delete_common_set_items(args.quest_state_enable, args.quest_state_disable)
 
+    # We're done massaging the set-based args at this point, so freeze them.
+    # They get used for a lot of membership tests and set arithmetic later on.
+    for arg_name in ENUM_SET_ARGS:
+        arg_value = getattr(args, arg_name)
+        if arg_value is not None:
+            setattr(args, arg_name, frozenset(arg_value))
+
     # Handle aggregate options
     if args.bosses_defeat:
         args.chameleon_defeat = True
@@ -1369,10 +1428,10 @@ def main():
             print(f' - Frame Seed: {save.frame_seed} (bunny mural: {(save.frame_seed % 50)+1}/50)')
             if save.unlockables.enabled:
                 print(' - Unlockables:')
-                print_columns(sorted(save.unlockables.enabled), columns=columns)
+                print_columns(save.unlockables.sorted_enabled, columns=columns)
             if args.verbose and save.unlockables.disabled:
                 print(' - Missing Unlockables:')
-                print_columns(sorted(save.unlockables.disabled), columns=columns)
+                print_columns(save.unlockables.sorted_disabled, columns=columns)
 
         # Make a note of fixing the checksum, if we were told to do so
         if args.fix_checksum:
@@ -1382,11 +1441,11 @@ def main():
         if loop_into_slots:
             for slot_idx in slot_indexes:
                 slot = save.slots[slot_idx]
-                slot_label = f'Slot {slot.index+1}'
+                label_prefix = f'Slot {slot.index+1}: '
 
                 # If we've been told to import slot data, do so now
                 if args.import_slot:
-                    print(f'{slot_label}: Importing slot data from: {args.import_slot}')
+                    print(f'{label_prefix}Importing slot data from: {args.import_slot}')
                     with open(args.import_slot, 'rb') as df:
                         slot.import_data(df.read())
                     do_save = True
@@ -1394,9 +1453,16 @@ def main():
                 # Actions to perform only if we have slot data follow...
                 if slot.has_data:
 
+                    # These get checked a *lot* down below.  The sets are updated
+                    # in-place whenever the bitfields change, so it's safe to hang
+                    # on to them for the whole slot.
+                    enabled_quest_states = slot.quest_state.enabled
+                    enabled_equipment = slot.equipment.enabled
+                    enabled_inventory = slot.inventory.enabled
+
                     # Show general slot info first, if we've been told to
                     if args.info:
-                        header = f'{slot_label}: {slot.timestamp}'
+                        header = f'{label_prefix}{slot.timestamp}'
                         print('')
                         print(header)
                         print('-'*len(header))
@@ -1422,32 +1488,32 @@ def main():
                         print(f'   - Steps: {slot.num_steps:,}')
                         print(f'   - Times Saved: {slot.num_saves}')
                         print(f'   - Times Died: {slot.num_deaths} (Times Hit: {slot.num_hits})')
-                        if Equipment.FIRECRACKER in slot.equipment.enabled:
+                        if Equipment.FIRECRACKER in enabled_equipment:
                             print(f'   - Firecrackers Collected: {slot.firecrackers_collected}')
                         if slot.bubbles_popped > 0:
                             print(f'   - Bubbles Popped: {slot.bubbles_popped}')
                         if slot.berries_eaten_while_full > 0:
                             print(f'   - Berries Eaten While Full: {slot.berries_eaten_while_full}')
                         print(f' - Consumables Inventory:')
-                        if Equipment.FIRECRACKER in slot.equipment.enabled:
+                        if Equipment.FIRECRACKER in enabled_equipment:
                             print(f'   - Firecrackers: {slot.firecrackers}')
                         print(f'   - Keys: {slot.keys}')
                         print(f'   - Matches: {slot.matches}')
                         if slot.nuts > 0:
                             print(f'   - Nuts: {slot.nuts}')
-                        if slot.equipment.enabled:
+                        if enabled_equipment:
                             print(' - Equipment Unlocked:')
-                            print_columns(sorted(slot.equipment.enabled), columns=columns)
+                            print_columns(slot.equipment.sorted_enabled, columns=columns)
                             print(f' - Selected Equipment: {slot.selected_equipment}')
                         if args.verbose and slot.equipment.disabled:
                             print(' - Missing Equipment:')
-                            print_columns(sorted(slot.equipment.disabled), columns=columns)
+                            print_columns(slot.equipment.sorted_disabled, columns=columns)
                         k_shards_collected = slot.kangaroo_state.num_collected()
                         k_shards_inserted = slot.kangaroo_state.num_inserted()
                         missing_k_shards = 3 - k_shards_collected - k_shards_inserted
-                        if slot.inventory.enabled or k_shards_collected:
+                        if enabled_inventory or k_shards_collected:
                             print(' - Inventory Unlocked:')
-                            report = list(slot.inventory.enabled)
+                            report = list(enabled_inventory)
                             if k_shards_collected > 0:
                                 if k_shards_inserted > 0:
                                     suffix = f', plus {k_shards_inserted} inserted'
@@ -1459,9 +1525,9 @@ def main():
                             # Filter out disabled inventory which might not make sense to report on
                             disabled = set()
                             for item in slot.inventory.disabled:
-                                if item == Inventory.S_MEDAL and QuestState.USED_S_MEDAL in slot.quest_state.enabled:
+                                if item == Inventory.S_MEDAL and QuestState.USED_S_MEDAL in enabled_quest_states:
                                     continue
-                                if item == Inventory.E_MEDAL and QuestState.USED_E_MEDAL in slot.quest_state.enabled:
+                                if item == Inventory.E_MEDAL and QuestState.USED_E_MEDAL in enabled_quest_states:
                                     continue
                                 disabled.add(item)
                             if missing_k_shards > 0:
@@ -1469,13 +1535,13 @@ def main():
                             print(' - Missing Inventory:')
                             print_columns(sorted(disabled), columns=columns)
                         print(f' - Eggs Collected: {len(slot.eggs.enabled)}')
-                        print_columns(sorted(slot.eggs.enabled), columns=columns)
+                        print_columns(slot.eggs.sorted_enabled, columns=columns)
                         if args.verbose and slot.eggs.disabled:
                             print(' - Missing Eggs:')
-                            print_columns(sorted(slot.eggs.disabled), columns=columns)
+                            print_columns(slot.eggs.sorted_disabled, columns=columns)
                         if len(slot.bunnies.enabled) > 0:
                             print(f' - Bunnies Collected: {len(slot.bunnies.enabled)}')
-                            print_columns(sorted(slot.bunnies.enabled), columns=columns)
+                            print_columns(slot.bunnies.sorted_enabled, columns=columns)
                         if len(slot.illegal_bunnies.enabled) > 0:
                             print(f' - Illegal Bunnies Collected: {len(slot.illegal_bunnies.enabled)}')
                             print('   ***WARNING***')
@@ -1485,25 +1551,25 @@ def main():
                             print('   ***WARNING***')
                         if args.verbose and slot.bunnies.disabled:
                             print(' - Missing Bunnies:')
-                            print_columns(sorted(slot.bunnies.disabled), columns=columns)
-                        if slot.quest_state.enabled:
+                            print_columns(slot.bunnies.sorted_disabled, columns=columns)
+                        if enabled_quest_states:
                             print(f' - Quest State Flags:')
-                            print_columns(sorted(slot.quest_state.enabled), columns=columns)
+                            print_columns(slot.quest_state.sorted_enabled, columns=columns)
                         if args.verbose and slot.quest_state.disabled:
                             disabled = set()
                             # Filter out disabled quest states which might not make sense to report on
                             for item in slot.quest_state.disabled:
-                                if item == QuestState.SHRINE_NO_DISC and QuestState.STATUE_NO_DISC in slot.quest_state.enabled:
+                                if item == QuestState.SHRINE_NO_DISC and QuestState.STATUE_NO_DISC in enabled_quest_states:
                                     continue
-                                if item == QuestState.STATUE_NO_DISC and QuestState.SHRINE_NO_DISC in slot.quest_state.enabled:
+                                if item == QuestState.STATUE_NO_DISC and QuestState.SHRINE_NO_DISC in enabled_quest_states:
                                     continue
-                                if item == QuestState.FIGHTING_EEL and QuestState.DEFEATED_EEL in slot.quest_state.enabled:
+                                if item == QuestState.FIGHTING_EEL and QuestState.DEFEATED_EEL in enabled_quest_states:
                                     continue
                                 disabled.add(item)
                             if disabled:
                                 print(f' - Missing Quest States:')
                                 print_columns(sorted(disabled), columns=columns)
-                        if any([flame.choice != FlameState.SEALED for flame in slot.flames]):
+                        if any(flame.choice != FlameState.SEALED for flame in slot.flames):
                             print(f' - Flame States:')
                             for flame in slot.flames:
                                 print(f'   - {flame.name}: {flame}')
@@ -1511,10 +1577,10 @@ def main():
                         print(f'   - Fruit Picked: {slot.picked_fruit}')
                         if slot.picked_fruit.has_stolen_nut:
                             print('     - Also has stolen a nut from a squirrel (counts as a picked fruit!)')
-                        if Equipment.FIRECRACKER in slot.equipment.enabled:
+                        if Equipment.FIRECRACKER in enabled_equipment:
                             print(f'   - Firecrackers Picked: {slot.picked_firecrackers}')
                         print(f'   - Ghosts Scared: {slot.ghosts_scared}')
-                        if any([s != BigStalactiteState.INTACT for s in slot.big_stalactites]):
+                        if any(s != BigStalactiteState.INTACT for s in slot.big_stalactites):
                             print('   - Big Stalactite States:')
                             to_report = []
                             for idx, stalactite in enumerate(slot.big_stalactites):
@@ -1530,7 +1596,7 @@ def main():
                             slot.kangaroo_state.get_cur_kangaroo_room_str(),
                             slot.kangaroo_state.state,
                             ))
-                        if QuestState.UNLOCK_STAMPS in slot.quest_state.enabled:
+                        if QuestState.UNLOCK_STAMPS in enabled_quest_states:
                             print(f'   - Minimap Stamps: {len(slot.stamps)}')
                         print(f' - Permanent Map Data:')
                         print(f'   - Chests Opened: {slot.chests_opened}')
@@ -1568,7 +1634,7 @@ def main():
                             print(f'   - Candles Lit: {len(slot.candles)}/{slot.candles.count()}')
                         if args.verbose and len(slot.candles.disabled) > 0:
                             print('   - Missing Candles-to-Light:')
-                            print_columns(sorted(slot.candles.disabled), indent='     ', columns=columns)
+                            print_columns(slot.candles.sorted_disabled, indent='     ', columns=columns)
                         if slot.detonators_triggered.count > 0:
                             print(f'   - Detonators Triggered: {slot.detonators_triggered}')
                         if slot.walls_blasted.count > 0:
@@ -1580,7 +1646,7 @@ def main():
                         if len(slot.cat_status) > 0:
                             cat_count = len(slot.cat_status)
                             has_wheel = False
-                            if CatStatus.WHEEL in slot.cat_status.enabled:
+                            if slot.cat_status.has(CatStatus.WHEEL):
                                 cat_count -= 1
                                 has_wheel = True
                             if cat_count > 0:
@@ -1593,14 +1659,20 @@ def main():
                             print(f'   - Red Manticore: {slot.red_manticore}')
                         if slot.teleports.enabled:
                             print(f' - Teleports Active: {len(slot.teleports.enabled)}')
-                            print_columns(sorted(slot.teleports.enabled), columns=columns)
+                            print_columns(slot.teleports.sorted_enabled, columns=columns)
                         if args.verbose and slot.teleports.disabled:
                             print(' - Missing Teleports:')
-                            print_columns(sorted(slot.teleports.disabled), columns=columns)
+                            print_columns(slot.teleports.sorted_disabled, columns=columns)
 
                         if do_slot_actions:
                             print('')
 
+                    # If we weren't asked to change anything, all that's left for
+                    # this slot is a possible export.
+                    if not do_slot_actions:
+                        export_slot_data(args, slot, label_prefix)
+                        continue
+
                     # Keep track of if we're modifying any disc equipment
                     doing_disc_actions = False
 
@@ -1609,17 +1681,17 @@ def main():
                     ###
 
                     if args.health:
-                        print(f'{slot_label}: Updating health to: {args.health}')
+                        print(f'{label_prefix}Updating health to: {args.health}')
                         slot.health.value = args.health
                         do_save = True
 
                     if args.gold_hearts:
-                        print(f'{slot_label}: Updating gold hearts count to: {args.gold_hearts}')
+                        print(f'{label_prefix}Updating gold hearts count to: {args.gold_hearts}')
                         slot.gold_hearts.value = args.gold_hearts
                         do_save = True
 
                     if args.spawn:
-                        print(f'{slot_label}: Setting spawnpoint to ({args.spawn.x}, {args.spawn.y})')
+                        print(f'{label_prefix}Setting spawnpoint to ({args.spawn.x}, {args.spawn.y})')
                         slot.spawn_room.x.value = args.spawn.x
                         slot.spawn_room.y.value = args.spawn.y
                         if args.spawn.x == 3 and args.spawn.y == 7:
@@ -1638,50 +1710,50 @@ def main():
                         do_save = True
 
                     if args.steps is not None:
-                        print(f'{slot_label}: Updating steps taken to: {args.steps}')
+                        print(f'{label_prefix}Updating steps taken to: {args.steps}')
                         slot.num_steps.value = args.steps
                         do_save = True
 
                     if args.deaths is not None:
-                        print(f'{slot_label}: Updating death count to: {args.deaths}')
+                        print(f'{label_prefix}Updating death count to: {args.deaths}')
                         slot.num_deaths.value = args.deaths
                         do_save = True
 
                     if args.saves is not None:
-                        print(f'{slot_label}: Updating save count to: {args.saves}')
+                        print(f'{label_prefix}Updating save count to: {args.saves}')
                         slot.num_saves.value = args.saves
                         do_save = True
 
                     if args.bubbles_popped is not None:
-                        print(f'{slot_label}: Updating bubbles-popped count to: {args.bubbles_popped}')
+                        print(f'{label_prefix}Updating bubbles-popped count to: {args.bubbles_popped}')
                         slot.bubbles_popped.value = args.bubbles_popped
                         do_save = True
 
                     if args.berries_eaten_while_full is not None:
-                        print(f'{slot_label}: Updating berries eaten while full count to: {args.berries_eaten_while_full}')
+                        print(f'{label_prefix}Updating berries eaten while full count to: {args.berries_eaten_while_full}')
                         slot.berries_eaten_while_full.value = args.berries_eaten_while_full
                         do_save = True
 
                     if args.ticks is not None:
-                        print(f'{slot_label}: Updating tick count to: {args.ticks}')
+                        print(f'{label_prefix}Updating tick count to: {args.ticks}')
                         slot.elapsed_ticks_ingame.value = args.ticks
                         slot.elapsed_ticks_withpause.value = args.ticks
                         do_save = True
 
                     if args.ticks_copy_ingame:
-                        print(f'{slot_label}: Copying ingame tick count to with-paused tick count')
+                        print(f'{label_prefix}Copying ingame tick count to with-paused tick count')
                         slot.elapsed_ticks_withpause.value = slot.elapsed_ticks_ingame.value
                         do_save = True
 
                     if args.wings_enable:
-                        if QuestState.WINGS not in slot.quest_state.enabled:
-                            print(f'{slot_label}: Enabling Wings / Flight Mode')
+                        if QuestState.WINGS not in enabled_quest_states:
+                            print(f'{label_prefix}Enabling Wings / Flight Mode')
                             slot.quest_state.enable(QuestState.WINGS)
                             do_save = True
 
                     if args.wings_disable:
-                        if QuestState.WINGS in slot.quest_state.enabled:
-                            print(f'{slot_label}: Disabling Wings / Flight Mode')
+                        if QuestState.WINGS in enabled_quest_states:
+                            print(f'{label_prefix}Disabling Wings / Flight Mode')
                             slot.quest_state.disable(QuestState.WINGS)
                             do_save = True
 
@@ -1690,57 +1762,59 @@ def main():
                     ###
 
                     if args.firecrackers is not None:
-                        print(f'{slot_label}: Updating firecracker count to: {args.firecrackers}')
+                        print(f'{label_prefix}Updating firecracker count to: {args.firecrackers}')
                         slot.firecrackers.value = args.firecrackers
                         do_save = True
-                        if args.firecrackers > 0 and Equipment.FIRECRACKER not in slot.equipment.enabled:
+                        if args.firecrackers > 0 and Equipment.FIRECRACKER not in enabled_equipment:
                             if args.equip_enable is None:
-                                args.equip_enable = set()
-                            args.equip_enable.add(Equipment.FIRECRACKER)
+                                args.equip_enable = frozenset()
+                            args.equip_enable |= {Equipment.FIRECRACKER}
 
                     if args.keys is not None:
-                        print(f'{slot_label}: Updating key count to: {args.keys}')
+                        print(f'{label_prefix}Updating key count to: {args.keys}')
                         slot.keys.value = args.keys
                         do_save = True
 
                     if args.matches is not None:
-                        print(f'{slot_label}: Updating match count to: {args.matches}')
+                        print(f'{label_prefix}Updating match count to: {args.matches}')
                         slot.matches.value = args.matches
                         do_save = True
 
                     if args.nuts is not None:
-                        print(f'{slot_label}: Updating stolen nut count to: {args.nuts}')
+                        print(f'{label_prefix}Updating stolen nut count to: {args.nuts}')
                         slot.nuts.value = args.nuts
                         do_save = True
 
                     changed_equipment = False
 
                     if args.equip_enable:
-                        for equip in sorted(args.equip_enable):
-                            if equip not in slot.equipment.enabled:
-                                print(f'{slot_label}: Enabling equipment: {equip}')
-                                slot.equipment.enable(equip)
-                                changed_equipment = True
-                                do_save = True
-                            if equip == Equipment.DISC:
-                                doing_disc_actions = True
+                        to_enable = sorted(args.equip_enable - enabled_equipment)
+                        for equip in to_enable:
+                            print(f'{label_prefix}Enabling equipment: {equip}')
+                        if to_enable:
+                            slot.equipment.set_bits(enable_list=to_enable)
+                            changed_equipment = True
+                            do_save = True
+                        if Equipment.DISC in args.equip_enable:
+                            doing_disc_actions = True
 
                     if args.equip_disable:
-                        for equip in sorted(args.equip_disable):
-                            if equip in slot.equipment.enabled:
-                                print(f'{slot_label}: Disabling equipment: {equip}')
-                                slot.equipment.disable(equip)
-                                changed_equipment = True
-                                do_save = True
-                            if equip == Equipment.DISC:
-                                doing_disc_actions = True
+                        to_disable = sorted(args.equip_disable & enabled_equipment)
+                        for equip in to_disable:
+                            print(f'{label_prefix}Disabling equipment: {equip}')
+                        if to_disable:
+                            slot.equipment.set_bits(disable_list=to_disable)
+                            changed_equipment = True
+                            do_save = True
+                        if Equipment.DISC in args.equip_disable:
+                            doing_disc_actions = True
 
                     # If we changed enabled equipment, we may need to change the currently-
                     # selected equipment field as well.
                     if changed_equipment:
-                        if len(slot.equipment.enabled) == 0:
+                        if len(enabled_equipment) == 0:
                             # If there's no equipment enabled, just revert our current selection to None
-                            print(f'{slot_label}: Setting currently-equipped item to none')
+                            print(f'{label_prefix}Setting currently-equipped item to none')
                             slot.selected_equipment.value = Equipped.NONE
                         else:
                             # Otherwise, we may need to update.  Create a couple mappings between these
@@ -1748,30 +1822,27 @@ def main():
                             equipped_to_equipment = {}
                             equipment_to_equipped = {}
                             for item in Equipped:
-                                try:
+                                if item.name in Equipment.__members__:
                                     equipped_to_equipment[item] = Equipment[item.name]
-                                except KeyError:
-                                    pass
                             for item in Equipment:
-                                try:
+                                if item.name in Equipped.__members__:
                                     equipment_to_equipped[item] = Equipped[item.name]
-                                except KeyError:
-                                    pass
                             if slot.selected_equipment.choice == Equipped.NONE \
-                                    or equipped_to_equipment[slot.selected_equipment.choice] not in slot.equipment.enabled:
+                                    or equipped_to_equipment[slot.selected_equipment.choice] not in enabled_equipment:
                                 # Enable the first equipment we have (alphabetically)
-                                to_equip = equipment_to_equipped[sorted(slot.equipment.enabled)[0]]
-                                print(f'{slot_label}: Setting currently-equipped item to: {to_equip}')
+                                to_equip = equipment_to_equipped[slot.equipment.sorted_enabled[0]]
+                                print(f'{label_prefix}Setting currently-equipped item to: {to_equip}')
                                 slot.selected_equipment.value = to_equip
 
                     if args.inventory_disable:
-                        for inv in sorted(args.inventory_disable):
-                            if inv in slot.inventory.enabled:
-                                print(f'{slot_label}: Disabling inventory item: {inv}')
-                                slot.inventory.disable(inv)
-                                do_save = True
-                            if inv == Inventory.MOCK_DISC:
-                                doing_disc_actions = True
+                        to_disable = sorted(args.inventory_disable & enabled_inventory)
+                        for inv in to_disable:
+                            print(f'{label_prefix}Disabling inventory item: {inv}')
+                        if to_disable:
+                            slot.inventory.set_bits(disable_list=to_disable)
+                            do_save = True
+                        if Inventory.MOCK_DISC in args.inventory_disable:
+                            doing_disc_actions = True
 
                     if args.inventory_enable:
 
@@ -1789,57 +1860,59 @@ def main():
                             all_inventory = all([i in args.inventory_enable for i in Inventory])
                             if all_equipment and all_inventory:
                                 print('NOTICE: Excluding Mock Disc from inventory unlocks.  (Specify --dont-fix-disc-state to add it anyway.)')
-                                args.inventory_enable.remove(Inventory.MOCK_DISC)
+                                args.inventory_enable -= {Inventory.MOCK_DISC}
 
                         # Now continue on...
-                        for inv in sorted(args.inventory_enable):
-                            if inv not in slot.inventory.enabled:
-                                print(f'{slot_label}: Enabling inventory item: {inv}')
-                                slot.inventory.enable(inv)
-                                do_save = True
-                            if inv == Inventory.MOCK_DISC:
-                                doing_disc_actions = True
+                        to_enable = sorted(args.inventory_enable - enabled_inventory)
+                        for inv in to_enable:
+                            print(f'{label_prefix}Enabling inventory item: {inv}')
+                        if to_enable:
+                            slot.inventory.set_bits(enable_list=to_enable)
+                            do_save = True
+                        if Inventory.MOCK_DISC in args.inventory_enable:
+                            doing_disc_actions = True
 
                     if args.map_enable:
-                        for map_var in sorted(args.map_enable):
-                            if map_var not in slot.quest_state.enabled:
-                                print(f'{slot_label}: Enabling map unlock: {map_var}')
-                                slot.quest_state.enable(map_var)
-                                do_save = True
+                        to_enable = sorted(args.map_enable - enabled_quest_states)
+                        for map_var in to_enable:
+                            print(f'{label_prefix}Enabling map unlock: {map_var}')
+                        if to_enable:
+                            slot.quest_state.set_bits(enable_list=to_enable)
+                            do_save = True
 
                     if args.upgrade_wand:
-                        if QuestState.BB_WAND not in slot.quest_state.enabled:
-                            print(f'{slot_label}: Upgrading B. Wand')
+                        if QuestState.BB_WAND not in enabled_quest_states:
+                            print(f'{label_prefix}Upgrading B. Wand')
                             slot.quest_state.enable(QuestState.BB_WAND)
                             do_save = True
 
                     if args.downgrade_wand:
-                        if QuestState.BB_WAND in slot.quest_state.enabled:
-                            print(f'{slot_label}: Downgrading B.B. Wand')
+                        if QuestState.BB_WAND in enabled_quest_states:
+                            print(f'{label_prefix}Downgrading B.B. Wand')
                             slot.quest_state.disable(QuestState.BB_WAND)
                             do_save = True
 
                     if args.egg65_enable:
-                        if QuestState.EGG_65 not in slot.quest_state.enabled:
-                            print(f'{slot_label}: Unlocking Egg 65')
+                        if QuestState.EGG_65 not in enabled_quest_states:
+                            print(f'{label_prefix}Unlocking Egg 65')
                             slot.quest_state.enable(QuestState.EGG_65)
                             do_save = True
 
                     if args.egg65_disable:
-                        if QuestState.EGG_65 in slot.quest_state.enabled:
-                            print(f'{slot_label}: Removing Egg 65')
+                        if QuestState.EGG_65 in enabled_quest_states:
+                            print(f'{label_prefix}Removing Egg 65')
                             slot.quest_state.disable(QuestState.EGG_65)
                             do_save = True
 
                     if args.cring_enable:
-                        if QuestState.CRING not in slot.quest_state.enabled:
-                            print(f"{slot_label}: Unlocking Cheater's Ring")
+                        if QuestState.CRING not in enabled_quest_states:
+                            print(f"{label_prefix}Unlocking Cheater's Ring")
                             slot.quest_state.enable(QuestState.CRING)
                             do_save = True
 
                     if args.cring_disable:
-                        if QuestState.CRING in slot.quest_state.enabled:
-                            print(f"{slot_label}: Removing Cheater's Ring")
+                        if QuestState.CRING in enabled_quest_states:
+                            print(f"{label_prefix}Removing Cheater's Ring")
                             slot.quest_state.disable(QuestState.CRING)
                             do_save = True
 
@@ -1848,25 +1921,27 @@ def main():
                     ###
 
                     if args.progress_enable:
-                        for progress in sorted(args.progress_enable):
-                            if progress not in slot.progress.enabled:
-                                print(f'{slot_label}: Enabling progress flag: {progress}')
-                                slot.progress.enable(progress)
-                                do_save = True
+                        to_enable = sorted(args.progress_enable - slot.progress.enabled)
+                        for progress in to_enable:
+                            print(f'{label_prefix}Enabling progress flag: {progress}')
+                        if to_enable:
+                            slot.progress.set_bits(enable_list=to_enable)
+                            do_save = True
 
                     if args.progress_disable:
-                        for progress in sorted(args.progress_disable):
-                            if progress in slot.progress.enabled:
-                                print(f'{slot_label}: Disabling progress flag: {progress}')
-                                slot.progress.disable(progress)
-                                do_save = True
+                        to_disable = sorted(args.progress_disable & slot.progress.enabled)
+                        for progress in to_disable:
+                            print(f'{label_prefix}Disabling progress flag: {progress}')
+                        if to_disable:
+                            slot.progress.set_bits(disable_list=to_disable)
+                            do_save = True
 
                     if args.move_disc_to_shrine:
-                        if Equipment.DISC in slot.equipment.enabled \
-                                and Inventory.MOCK_DISC not in slot.inventory.enabled \
-                                and QuestState.STATUE_NO_DISC not in slot.quest_state.enabled \
-                                and QuestState.SHRINE_NO_DISC in slot.quest_state.enabled:
-                            print(f'{slot_label}: Moving Mock Disc from Dog Head Statue to Shrine')
+                        if Equipment.DISC in enabled_equipment \
+                                and Inventory.MOCK_DISC not in enabled_inventory \
+                                and QuestState.STATUE_NO_DISC not in enabled_quest_states \
+                                and QuestState.SHRINE_NO_DISC in enabled_quest_states:
+                            print(f'{label_prefix}Moving Mock Disc from Dog Head Statue to Shrine')
                             slot.quest_state.enable(QuestState.STATUE_NO_DISC)
                             slot.quest_state.disable(QuestState.SHRINE_NO_DISC)
                             do_save = True
@@ -1874,11 +1949,11 @@ def main():
                             print('*** WARNING: Conditions not met for --move-disc-to-shrine, skipping. ***')
 
                     if args.move_disc_to_statue:
-                        if Equipment.DISC in slot.equipment.enabled \
-                                and Inventory.MOCK_DISC not in slot.inventory.enabled \
-                                and QuestState.STATUE_NO_DISC in slot.quest_state.enabled \
-                                and QuestState.SHRINE_NO_DISC not in slot.quest_state.enabled:
-                            print(f'{slot_label}: Moving Mock Disc from Shrine to Dog Head Statue')
+                        if Equipment.DISC in enabled_equipment \
+                                and Inventory.MOCK_DISC not in enabled_inventory \
+                                and QuestState.STATUE_NO_DISC in enabled_quest_states \
+                                and QuestState.SHRINE_NO_DISC not in enabled_quest_states:
+                            print(f'{label_prefix}Moving Mock Disc from Shrine to Dog Head Statue')
                             slot.quest_state.disable(QuestState.STATUE_NO_DISC)
                             slot.quest_state.enable(QuestState.SHRINE_NO_DISC)
                             do_save = True
@@ -1886,94 +1961,98 @@ def main():
                             print('*** WARNING: Conditions not met for --move-disc-to-statue, skipping. ***')
 
                     if args.cats_free:
-                        for cat in sorted(args.cats_free):
-                            if cat not in slot.cat_status.enabled:
-                                print(f'{slot_label}: Freeing cat: {cat}')
-                                slot.cat_status.enable(cat)
-                                do_save = True
+                        to_enable = sorted(args.cats_free - slot.cat_status.enabled)
+                        for cat in to_enable:
+                            print(f'{label_prefix}Freeing cat: {cat}')
+                        if to_enable:
+                            slot.cat_status.set_bits(enable_list=to_enable)
+                            do_save = True
 
                     if args.cats_cage:
-                        for cat in sorted(args.cats_cage):
-                            if cat in slot.cat_status.enabled:
-                                print(f'{slot_label}: Re-caging cat: {cat}')
-                                slot.cat_status.disable(cat)
-                                do_save = True
+                        to_disable = sorted(args.cats_cage & slot.cat_status.enabled)
+                        for cat in to_disable:
+                            print(f'{label_prefix}Re-caging cat: {cat}')
+                        if to_disable:
+                            slot.cat_status.set_bits(disable_list=to_disable)
+                            do_save = True
 
                     if args.kangaroo_room is not None:
-                        print(f'{slot_label}: Setting next kangaroo room to: {args.kangaroo_room}')
+                        print(f'{label_prefix}Setting next kangaroo room to: {args.kangaroo_room}')
                         slot.kangaroo_state.force_kangaroo_room(args.kangaroo_room)
                         do_save = True
 
                     if args.kshard_collect is not None:
-                        print(f'{slot_label}: Setting total number of collected K. Shards to: {args.kshard_collect}')
+                        print(f'{label_prefix}Setting total number of collected K. Shards to: {args.kshard_collect}')
                         slot.kangaroo_state.set_shard_state(args.kshard_collect, KangarooShardState.COLLECTED)
                         do_save = True
 
                     if args.kshard_insert is not None:
-                        print(f'{slot_label}: Setting total number of inserted K. Shards to: {args.kshard_insert}')
+                        print(f'{label_prefix}Setting total number of inserted K. Shards to: {args.kshard_insert}')
                         slot.kangaroo_state.set_shard_state(args.kshard_insert, KangarooShardState.INSERTED)
                         do_save = True
 
                     if args.s_medal_insert:
-                        if QuestState.USED_S_MEDAL not in slot.quest_state.enabled:
-                            print(f'{slot_label}: Marking S. Medal as inserted')
+                        if QuestState.USED_S_MEDAL not in enabled_quest_states:
+                            print(f'{label_prefix}Marking S. Medal as inserted')
                             slot.quest_state.enable(QuestState.USED_S_MEDAL)
                             do_save = True
 
                     if args.s_medal_remove:
-                        if QuestState.USED_S_MEDAL in slot.quest_state.enabled:
-                            print(f'{slot_label}: Removing S. Medal from recess')
+                        if QuestState.USED_S_MEDAL in enabled_quest_states:
+                            print(f'{label_prefix}Removing S. Medal from recess')
                             slot.quest_state.disable(QuestState.USED_S_MEDAL)
                             do_save = True
 
                     if args.e_medal_insert:
-                        if QuestState.USED_E_MEDAL not in slot.quest_state.enabled:
-                            print(f'{slot_label}: Marking E. Medal as inserted')
+                        if QuestState.USED_E_MEDAL not in enabled_quest_states:
+                            print(f'{label_prefix}Marking E. Medal as inserted')
                             slot.quest_state.enable(QuestState.USED_E_MEDAL)
                             do_save = True
 
                     if args.e_medal_remove:
-                        if QuestState.USED_E_MEDAL in slot.quest_state.enabled:
-                            print(f'{slot_label}: Removing E. Medal from recess')
+                        if QuestState.USED_E_MEDAL in enabled_quest_states:
+                            print(f'{label_prefix}Removing E. Medal from recess')
                             slot.quest_state.disable(QuestState.USED_E_MEDAL)
                             do_save = True
 
                     if args.teleport_enable:
-                        for teleport in sorted(args.teleport_enable):
-                            if teleport not in slot.teleports.enabled:
-                                print(f'{slot_label}: Enabling teleport: {teleport}')
-                                slot.teleports.enable(teleport)
-                                do_save = True
+                        to_enable = sorted(args.teleport_enable - slot.teleports.enabled)
+                        for teleport in to_enable:
+                            print(f'{label_prefix}Enabling teleport: {teleport}')
+                        if to_enable:
+                            slot.teleports.set_bits(enable_list=to_enable)
+                            do_save = True
 
                     if args.teleport_disable:
-                        for teleport in sorted(args.teleport_disable):
-                            if teleport in slot.teleports.enabled:
-                                print(f'{slot_label}: Disabling teleport: {teleport}')
-                                slot.teleports.disable(teleport)
-                                do_save = True
+                        to_disable = sorted(args.teleport_disable & slot.teleports.enabled)
+                        for teleport in to_disable:
+                            print(f'{label_prefix}Disabling teleport: {teleport}')
+                        if to_disable:
+                            slot.teleports.set_bits(disable_list=to_disable)
+                            do_save = True
 
                     if args.mural_clear:
-                        print(f'{slot_label}: Clearing all mural pixels')
+                        print(f'{label_prefix}Clearing all mural pixels')
                         slot.mural.clear()
                         do_save = True
 
                     if args.mural_default:
-                        print(f'{slot_label}: Setting mural to its default state')
+                        print(f'{label_prefix}Setting mural to its default state')
                         slot.mural.to_default()
                         do_save = True
 
                     if args.mural_solved:
-                        print(f'{slot_label}: Setting mural to its solved state (NOTE: you will need to activate one pixel to get the door to open)')
+                        print(f'{label_prefix}Setting mural to its solved state (NOTE: you will need to activate one pixel to get the door to open)')
                         slot.mural.to_solved()
                         do_save = True
 
                     if args.mural_raw_import:
-                        print(f'{slot_label}: Importing raw bunny mural data in "{args.mural_raw_import}"')
+                        print(f'{label_prefix}Importing raw bunny mural data in "{args.mural_raw_import}"')
                         slot.mural.import_raw(args.mural_raw_import)
                         do_save = True
 
                     if args.mural_raw_export:
-                        print(f'{slot_label}: Exporting raw bunny mural data to: {args.mural_raw_export}')
+                        print(f'{label_prefix}Exporting raw bunny mural data to: {args.mural_raw_export}')
                         if check_file_overwrite(args, args.mural_raw_export):
                             slot.mural.export_raw(args.mural_raw_export)
                             print('Raw bunny mural data exported!')
@@ -1983,55 +2062,47 @@ def main():
                     if has_image_support:
 
                         if args.mural_image_import:
-                            print(f'{slot_label}: Importing image "{args.mural_image_import}" to bunny mural')
+                            print(f'{label_prefix}Importing image "{args.mural_image_import}" to bunny mural')
                             slot.mural.import_image(args.mural_image_import)
                             do_save = True
 
                         if args.mural_image_export:
-                            print(f'{slot_label}: Exporting bunny mural image to: {args.mural_image_export}')
+                            print(f'{label_prefix}Exporting bunny mural image to: {args.mural_image_export}')
                             if check_file_overwrite(args, args.mural_image_export):
                                 slot.mural.export_image(args.mural_image_export)
                                 print('Bunny mural exported!')
                             else:
                                 print('NOTICE: Bunny mural NOT exported')
 
-                    for arg, status in [
-                            (args.flame_collect, FlameState.COLLECTED),
-                            (args.flame_use, FlameState.USED),
-                            ]:
+                    for arg_name, status in FLAME_ACTIONS:
+                        arg = getattr(args, arg_name)
                         if arg:
-                            if 'all' in arg:
-                                flames = slot.flames
-                            else:
-                                flames = []
-                                for letter in arg:
-                                    flames.append(slot.flames[letter])
-                            for flame in flames:
-                                print(f'{slot_label}: Updating {flame.name} status to: {status}')
+                            for flame in pick_flames(slot, arg):
+                                print(f'{label_prefix}Updating {flame.name} status to: {status}')
                                 flame.value = status
                             do_save = True
 
                     if args.blue_manticore:
                         if slot.blue_manticore.choice != args.blue_manticore:
-                            print(f'{slot_label}: Setting Blue Manticore state to: {args.blue_manticore}')
+                            print(f'{label_prefix}Setting Blue Manticore state to: {args.blue_manticore}')
                             slot.blue_manticore.value = args.blue_manticore
                             do_save = True
 
                     if args.red_manticore:
                         if slot.red_manticore.choice != args.red_manticore:
-                            print(f'{slot_label}: Setting Red Manticore state to: {args.red_manticore}')
+                            print(f'{label_prefix}Setting Red Manticore state to: {args.red_manticore}')
                             slot.red_manticore.value = args.red_manticore
                             do_save = True
 
                     if args.torus_enable:
-                        if QuestState.TORUS not in slot.quest_state.enabled:
-                            print(f'{slot_label}: Enabling Teleportation Torus')
+                        if QuestState.TORUS not in enabled_quest_states:
+                            print(f'{label_prefix}Enabling Teleportation Torus')
                             slot.quest_state.enable(QuestState.TORUS)
                             do_save = True
 
                     if args.torus_disable:
-                        if QuestState.TORUS in slot.quest_state.enabled:
-                            print(f'{slot_label}: Disabling Teleportation Torus')
+                        if QuestState.TORUS in enabled_quest_states:
+                            print(f'{label_prefix}Disabling Teleportation Torus')
                             slot.quest_state.disable(QuestState.TORUS)
                             do_save = True
 
@@ -2040,50 +2111,50 @@ def main():
                     # got to be way overengineered.  So, back to dumb hardcoding.  :)
 
                     if args.chameleon_defeat:
-                        if QuestState.DEFEATED_CHAMELEON not in slot.quest_state.enabled:
-                            print(f'{slot_label}: Marking Chameleon boss as defeated')
+                        if QuestState.DEFEATED_CHAMELEON not in enabled_quest_states:
+                            print(f'{label_prefix}Marking Chameleon boss as defeated')
                             slot.quest_state.enable(QuestState.DEFEATED_CHAMELEON)
                             do_save = True
 
                     if args.chameleon_respawn:
-                        if QuestState.DEFEATED_CHAMELEON in slot.quest_state.enabled:
-                            print(f'{slot_label}: Respawning Chameleon boss')
+                        if QuestState.DEFEATED_CHAMELEON in enabled_quest_states:
+                            print(f'{label_prefix}Respawning Chameleon boss')
                             slot.quest_state.disable(QuestState.DEFEATED_CHAMELEON)
                             do_save = True
 
                     if args.bat_defeat:
-                        if QuestState.DEFEATED_BAT not in slot.quest_state.enabled:
-                            print(f'{slot_label}: Marking Bat boss as defeated')
+                        if QuestState.DEFEATED_BAT not in enabled_quest_states:
+                            print(f'{label_prefix}Marking Bat boss as defeated')
                             slot.quest_state.enable(QuestState.DEFEATED_BAT)
                             do_save = True
 
                     if args.bat_respawn:
-                        if QuestState.DEFEATED_BAT in slot.quest_state.enabled:
-                            print(f'{slot_label}: Respawning Bat boss')
+                        if QuestState.DEFEATED_BAT in enabled_quest_states:
+                            print(f'{label_prefix}Respawning Bat boss')
                             slot.quest_state.disable(QuestState.DEFEATED_BAT)
                             do_save = True
 
                     if args.ostrich_defeat:
                         # Vanilla game state implies both "freed" and "defeated" states
-                        if QuestState.DEFEATED_OSTRICH not in slot.quest_state.enabled \
-                                or QuestState.FREED_OSTRICH not in slot.quest_state.enabled:
-                            print(f'{slot_label}: Marking Ostrich bosses as defeated (and stopping platforms, if necessary)')
-                            if QuestState.DEFEATED_OSTRICH not in slot.quest_state.enabled:
+                        if QuestState.DEFEATED_OSTRICH not in enabled_quest_states \
+                                or QuestState.FREED_OSTRICH not in enabled_quest_states:
+                            print(f'{label_prefix}Marking Ostrich bosses as defeated (and stopping platforms, if necessary)')
+                            if QuestState.DEFEATED_OSTRICH not in enabled_quest_states:
                                 slot.quest_state.enable(QuestState.DEFEATED_OSTRICH)
-                            if QuestState.FREED_OSTRICH not in slot.quest_state.enabled:
+                            if QuestState.FREED_OSTRICH not in enabled_quest_states:
                                 slot.quest_state.enable(QuestState.FREED_OSTRICH)
                             # Also stop the elevator
                             slot.elevators.inactive.enable(ElevatorDisabled.OSTRICH)
                             do_save = True
 
                     if args.ostrich_respawn:
-                        if QuestState.DEFEATED_OSTRICH in slot.quest_state.enabled \
-                                or QuestState.FREED_OSTRICH in slot.quest_state.enabled:
-                            print(f'{slot_label}: Respawning Ostrich Bosses (to pre-freed state, unpressing purple')
+                        if QuestState.DEFEATED_OSTRICH in enabled_quest_states \
+                                or QuestState.FREED_OSTRICH in enabled_quest_states:
+                            print(f'{label_prefix}Respawning Ostrich Bosses (to pre-freed state, unpressing purple')
                             print('        button and reactivating platforms if necessary)')
-                            if QuestState.DEFEATED_OSTRICH in slot.quest_state.enabled:
+                            if QuestState.DEFEATED_OSTRICH in enabled_quest_states:
                                 slot.quest_state.disable(QuestState.DEFEATED_OSTRICH)
-                            if QuestState.FREED_OSTRICH in slot.quest_state.enabled:
+                            if QuestState.FREED_OSTRICH in enabled_quest_states:
                                 slot.quest_state.disable(QuestState.FREED_OSTRICH)
                             # Also undo the purple button press so that the ostrich doesn't
                             # immediately start attacking again.  Just hardcoding the index here
@@ -2094,20 +2165,20 @@ def main():
                         do_save = True
 
                     if args.eel_defeat:
-                        if QuestState.DEFEATED_EEL not in slot.quest_state.enabled:
-                            print(f'{slot_label}: Marking Eel/Bonefish boss as defeated')
+                        if QuestState.DEFEATED_EEL not in enabled_quest_states:
+                            print(f'{label_prefix}Marking Eel/Bonefish boss as defeated')
                             slot.quest_state.enable(QuestState.DEFEATED_EEL)
                             # Also clear "fighting" state, if we have it
-                            if QuestState.FIGHTING_EEL in slot.quest_state.enabled:
+                            if QuestState.FIGHTING_EEL in enabled_quest_states:
                                 slot.quest_state.disable(QuestState.FIGHTING_EEL)
                             do_save = True
 
                     if args.eel_respawn:
-                        if QuestState.DEFEATED_EEL in slot.quest_state.enabled:
-                            print(f'{slot_label}: Respawning Eel/Bonefish boss (to pre-awakened state)')
+                        if QuestState.DEFEATED_EEL in enabled_quest_states:
+                            print(f'{label_prefix}Respawning Eel/Bonefish boss (to pre-awakened state)')
                             slot.quest_state.disable(QuestState.DEFEATED_EEL)
                             # Also clear "fighting" state, if we have it
-                            if QuestState.FIGHTING_EEL in slot.quest_state.enabled:
+                            if QuestState.FIGHTING_EEL in enabled_quest_states:
                                 slot.quest_state.disable(QuestState.FIGHTING_EEL)
                             do_save = True
 
@@ -2116,62 +2187,66 @@ def main():
                     ###
 
                     if args.egg_enable:
-                        for egg in sorted(args.egg_enable):
-                            if egg not in slot.eggs.enabled:
-                                print(f'{slot_label}: Enabling egg: {egg}')
-                                slot.eggs.enable(egg)
-                                do_save = True
+                        to_enable = sorted(args.egg_enable - slot.eggs.enabled)
+                        for egg in to_enable:
+                            print(f'{label_prefix}Enabling egg: {egg}')
+                        if to_enable:
+                            slot.eggs.set_bits(enable_list=to_enable)
+                            do_save = True
 
                     if args.egg_disable:
-                        for egg in sorted(args.egg_disable):
-                            if egg in slot.eggs.enabled:
-                                print(f'{slot_label}: Disabling egg: {egg}')
-                                slot.eggs.disable(egg)
-                                do_save = True
+                        to_disable = sorted(args.egg_disable & slot.eggs.enabled)
+                        for egg in to_disable:
+                            print(f'{label_prefix}Disabling egg: {egg}')
+                        if to_disable:
+                            slot.eggs.set_bits(disable_list=to_disable)
+                            do_save = True
 
                     if args.bunny_disable:
-                        for bunny in sorted(args.bunny_disable):
-                            if bunny in slot.bunnies.enabled:
-                                print(f'{slot_label}: Disabling bunny: {bunny}')
-                                slot.bunnies.disable(bunny)
-                                do_save = True
+                        to_disable = sorted(args.bunny_disable & slot.bunnies.enabled)
+                        for bunny in to_disable:
+                            print(f'{label_prefix}Disabling bunny: {bunny}')
+                        if to_disable:
+                            slot.bunnies.set_bits(disable_list=to_disable)
+                            do_save = True
 
                     if args.bunny_enable:
-                        for bunny in sorted(args.bunny_enable):
-                            if bunny not in slot.bunnies.enabled:
-                                print(f'{slot_label}: Enabling bunny: {bunny}')
-                                slot.bunnies.enable(bunny)
-                                do_save = True
+                        to_enable = sorted(args.bunny_enable - slot.bunnies.enabled)
+                        for bunny in to_enable:
+                            print(f'{label_prefix}Enabling bunny: {bunny}')
+                        if to_enable:
+                            slot.bunnies.set_bits(enable_list=to_enable)
+                            do_save = True
 
                     if args.illegal_bunny_clear:
                         if slot.illegal_bunnies.enabled:
-                            print(f'{slot_label}: Clearing illegal bunnies')
+                            print(f'{label_prefix}Clearing illegal bunnies')
                             slot.illegal_bunnies.disable_all()
                             do_save = True
 
                     if args.respawn_consumables:
-                        print(f'{slot_label}: Respawning fruit and firecrackers')
+                        print(f'{label_prefix}Respawning fruit and firecrackers')
                         slot.picked_fruit.clear()
                         slot.picked_firecrackers.clear()
                         do_save = True
 
                     if args.clear_ghosts:
-                        print(f'{slot_label}: Clearing ghosts')
+                        print(f'{label_prefix}Clearing ghosts')
                         slot.ghosts_scared.fill()
                         do_save = True
 
                     if args.respawn_ghosts:
-                        print(f'{slot_label}: Respawning ghosts')
+                        print(f'{label_prefix}Respawning ghosts')
                         slot.ghosts_scared.clear()
                         do_save = True
 
                     if args.respawn_squirrels:
-                        print(f'{slot_label}: Respawning squirrels')
+                        print(f'{label_prefix}Respawning squirrels')
                         slot.squirrels_scared.clear()
                         do_save = True
 
                     if args.buttons_press:
-                        print(f'{slot_label}: Marking all buttons as pressed')
+                        print(f'{label_prefix}Marking all buttons as pressed')
                         slot.yellow_buttons_pressed.fill()
                         slot.purple_buttons_pressed.fill()
                         slot.green_buttons_pressed.fill()
@@ -2180,7 +2255,7 @@ def main():
                         do_save = True
 
                     if args.buttons_reset:
-                        print(f'{slot_label}: Marking all buttons as not pressed')
+                        print(f'{label_prefix}Marking all buttons as not pressed')
                         slot.yellow_buttons_pressed.clear()
                         slot.purple_buttons_pressed.clear()
                         slot.green_buttons_pressed.clear()
@@ -2189,105 +2264,109 @@ def main():
                         do_save = True
 
                     if args.doors_open:
-                        print(f'{slot_label}: Marking all button-controlled doors as opened')
+                        print(f'{label_prefix}Marking all button-controlled doors as opened')
                         slot.button_doors_opened.fill()
                         do_save = True
 
                     if args.doors_close:
-                        print(f'{slot_label}: Marking all button-controlled doors as closed')
+                        print(f'{label_prefix}Marking all button-controlled doors as closed')
                         slot.button_doors_opened.clear()
                         do_save = True
 
                     if args.lockable_unlock:
-                        print(f'{slot_label}: Unlocking all lockable doors')
+                        print(f'{label_prefix}Unlocking all lockable doors')
                         slot.locked_doors.fill()
                         do_save = True
 
                     if args.lockable_lock:
-                        print(f'{slot_label}: Locking all lockable doors')
+                        print(f'{label_prefix}Locking all lockable doors')
                         slot.locked_doors.clear()
                         do_save = True
 
                     if args.eggdoor_open:
-                        for eggdoor in sorted(args.eggdoor_open):
-                            if eggdoor not in slot.egg_doors.enabled:
-                                print(f'{slot_label}: Opening egg door: {eggdoor}')
-                                slot.egg_doors.enable(eggdoor)
-                                do_save = True
+                        to_enable = sorted(args.eggdoor_open - slot.egg_doors.enabled)
+                        for eggdoor in to_enable:
+                            print(f'{label_prefix}Opening egg door: {eggdoor}')
+                        if to_enable:
+                            slot.egg_doors.set_bits(enable_list=to_enable)
+                            do_save = True
 
                     if args.eggdoor_close:
-                        for eggdoor in sorted(args.eggdoor_close):
-                            if eggdoor in slot.egg_doors.enabled:
-                                print(f'{slot_label}: Closing egg door: {eggdoor}')
-                                slot.egg_doors.disable(eggdoor)
-                                do_save = True
+                        to_disable = sorted(args.eggdoor_close & slot.egg_doors.enabled)
+                        for eggdoor in to_disable:
+                            print(f'{label_prefix}Closing egg door: {eggdoor}')
+                        if to_disable:
+                            slot.egg_doors.set_bits(disable_list=to_disable)
+                            do_save = True
 
                     if args.clear_invalid_walls:
-                        print(f'{slot_label}: Clearing invalid wall-opening records')
+                        print(f'{label_prefix}Clearing invalid wall-opening records')
                         slot.moved_walls.remove_invalid()
                         slot.invalid_pink_buttons.disable_all()
                         do_save = True
 
                     if args.walls_open:
-                        print(f'{slot_label}: Opening all movable walls')
+                        print(f'{label_prefix}Opening all movable walls')
                         slot.moved_walls.fill()
                         do_save = True
 
                     if args.walls_close:
-                        print(f'{slot_label}: Closing all movable walls')
+                        print(f'{label_prefix}Closing all movable walls')
                         slot.moved_walls.clear()
                         do_save = True
 
                     if args.house_open:
-                        print(f'{slot_label}: Marking doors around the house as opened')
+                        print(f'{label_prefix}Marking doors around the house as opened')
                         for state in [
                                 QuestState.HOUSE_OPEN,
                                 QuestState.OFFICE_OPEN,
                                 QuestState.CLOSET_OPEN,
                                 ]:
-                            if state not in slot.quest_state.enabled:
+                            if state not in enabled_quest_states:
                                 slot.quest_state.enable(state)
                         do_save = True
 
                     if args.house_close:
-                        print(f'{slot_label}: Marking doors around the house as closed')
+                        print(f'{label_prefix}Marking doors around the house as closed')
                         for state in [
                                 QuestState.HOUSE_OPEN,
                                 QuestState.OFFICE_OPEN,
                                 QuestState.CLOSET_OPEN,
                                 ]:
-                            if state in slot.quest_state.enabled:
+                            if state in enabled_quest_states:
                                 slot.quest_state.disable(state)
                         do_save = True
 
                     if args.chests_open:
-                        print(f'{slot_label}: Marking all chests as opened')
+                        print(f'{label_prefix}Marking all chests as opened')
                         slot.chests_opened.fill()
                         slot.layer1_chests_opened.fill()
                         do_save = True
 
                     if args.chests_close:
-                        print(f'{slot_label}: Marking all chests as closed')
+                        print(f'{label_prefix}Marking all chests as closed')
                         slot.chests_opened.clear()
                         slot.layer1_chests_opened.clear()
                         do_save = True
 
                     if args.candles_enable:
-                        for candle in sorted(args.candles_enable):
-                            if candle not in slot.candles.enabled:
-                                print(f'{slot_label}: Lighting candle: {candle}')
-                                slot.candles.enable(candle)
-                                do_save = True
+                        to_enable = sorted(args.candles_enable - slot.candles.enabled)
+                        for candle in to_enable:
+                            print(f'{label_prefix}Lighting candle: {candle}')
+                        if to_enable:
+                            slot.candles.set_bits(enable_list=to_enable)
+                            do_save = True
 
                     if args.candles_disable:
-                        for candle in sorted(args.candles_disable):
-                            if candle in slot.candles.enabled:
-                                print(f'{slot_label}: Blowing out candle: {candle}')
-                                slot.candles.disable(candle)
-                                do_save = True
+                        to_disable = sorted(args.candles_disable & slot.candles.enabled)
+                        for candle in to_disable:
+                            print(f'{label_prefix}Blowing out candle: {candle}')
+                        if to_disable:
+                            slot.candles.set_bits(disable_list=to_disable)
+                            do_save = True
 
                     if args.solve_cranks:
-                        print(f'{slot_label}: Setting crank puzzles to "solved" states (excluding Seahorse Boss)')
+                        print(f'{label_prefix}Setting crank puzzles to "solved" states (excluding Seahorse Boss)')
                         # These values are obviously not the *only* values which work
                         # Water reservoir at (7, 11)
                         slot.cranks[7].value = 464
@@ -2303,23 +2382,23 @@ def main():
                         do_save = True
 
                     if args.reservoirs_fill:
-                        print(f'{slot_label}: Filling all reservoirs')
+                        print(f'{label_prefix}Filling all reservoirs')
                         slot.fill_levels.fill()
                         do_save = True
 
                     if args.reservoirs_empty:
-                        print(f'{slot_label}: Emptying all reservoirs')
+                        print(f'{label_prefix}Emptying all reservoirs')
                         slot.fill_levels.empty()
                         do_save = True
 
                     if args.detonators_activate:
-                        print(f'{slot_label}: Activating all shortcut detonators')
+                        print(f'{label_prefix}Activating all shortcut detonators')
                         slot.walls_blasted.fill()
                         slot.detonators_triggered.fill()
                         do_save = True
 
                     if args.detonators_rearm:
-                        print(f'{slot_label}: Re-arming all shortcut detonators')
+                        print(f'{label_prefix}Re-arming all shortcut detonators')
                         if not args.respawn_destroyed_tiles:
                             print('NOTICE: In order to fill in destroyed passageways, also specify --respawn-destroyed-tiles')
                         slot.walls_blasted.clear()
@@ -2327,23 +2406,23 @@ def main():
                         do_save = True
 
                     if args.respawn_destroyed_tiles:
-                        print(f'{slot_label}: Respawning all destroyed tiles')
+                        print(f'{label_prefix}Respawning all destroyed tiles')
                         slot.destructionmap.clear_map()
                         do_save = True
 
                     if args.big_stalactites_state is not None:
-                        print(f'{slot_label}: Setting all big stalactites to state: {args.big_stalactites_state}')
+                        print(f'{label_prefix}Setting all big stalactites to state: {args.big_stalactites_state}')
                         slot.big_stalactites.set_state(args.big_stalactites_state)
                         do_save = True
 
                     if args.small_deposits_break:
-                        print(f'{slot_label}: Breaking/clearing all small stalactites/stalagmites/icicles')
+                        print(f'{label_prefix}Breaking/clearing all small stalactites/stalagmites/icicles')
                         slot.deposit_small_broken.fill()
                         slot.icicles_broken.fill()
                         do_save = True
 
                     if args.small_deposits_respawn:
-                        print(f'{slot_label}: Respawning all small stalactites/stalagmites/icicles')
+                        print(f'{label_prefix}Respawning all small stalactites/stalagmites/icicles')
                         slot.deposit_small_broken.clear()
                         slot.icicles_broken.clear()
                         do_save = True
@@ -2353,29 +2432,29 @@ def main():
                     ###
 
                     if args.reveal_map:
-                        print(f'{slot_label}: Revealing entire minimap')
+                        print(f'{label_prefix}Revealing entire minimap')
                         slot.minimap.fill_map()
                         do_save = True
 
                     if args.clear_map:
-                        print(f'{slot_label}: Clearing entire minimap')
+                        print(f'{label_prefix}Clearing entire minimap')
                         slot.minimap.clear_map(playable_only=False)
                         do_save = True
 
                     if args.clear_pencil:
-                        print(f'{slot_label}: Clearing all minimap pencil drawings')
+                        print(f'{label_prefix}Clearing all minimap pencil drawings')
                         slot.pencilmap.clear_map(playable_only=False)
                         do_save = True
 
                     if args.clear_stamps:
-                        print(f'{slot_label}: Clearing all minimap stamps')
+                        print(f'{label_prefix}Clearing all minimap stamps')
                         slot.stamps.clear()
                         do_save = True
 
                     if has_image_support:
 
                         if args.pencil_image_import:
-                            print(f'{slot_label}: Importing image "{args.pencil_image_import}" to pencil minimap layer')
+                            print(f'{label_prefix}Importing image "{args.pencil_image_import}" to pencil minimap layer')
                             slot.pencilmap.import_image(
                                     args.pencil_image_import,
                                     args.pencil_image_full,
@@ -2384,7 +2463,7 @@ def main():
                             do_save = True
 
                         if args.pencil_image_export:
-                            print(f'{slot_label}: Exporting pencil minimap layer to: {args.pencil_image_export}')
+                            print(f'{label_prefix}Exporting pencil minimap layer to: {args.pencil_image_export}')
                             if check_file_overwrite(args, args.pencil_image_export):
                                 slot.pencilmap.export_image(args.pencil_image_export)
                                 print('Image exported!')
@@ -2403,8 +2482,8 @@ def main():
 
                         do_save = True
 
-                        if Inventory.MOCK_DISC in slot.inventory.enabled \
-                                and Equipment.DISC in slot.equipment.enabled:
+                        if Inventory.MOCK_DISC in enabled_inventory \
+                                and Equipment.DISC in enabled_equipment:
 
                             # Both Disc + Mock Disc
                             print(textwrap.dedent("""
@@ -2424,22 +2503,22 @@ def main():
                                 """))
                             return False
 
-                        elif Inventory.MOCK_DISC in slot.inventory.enabled:
+                        elif Inventory.MOCK_DISC in enabled_inventory:
 
                             # Just the Mock Disc.  Ony one valid state here
-                            print(f'{slot_label}: Fixing Disc Quest State to accomodate Mock Disc in inventory.  (Specify --dont-fix-disc-state to disable this behavior.)')
+                            print(f'{label_prefix}Fixing Disc Quest State to accomodate Mock Disc in inventory.  (Specify --dont-fix-disc-state to disable this behavior.)')
                             slot.quest_state.enable(QuestState.STATUE_NO_DISC)
                             slot.quest_state.enable(QuestState.SHRINE_NO_DISC)
 
-                        elif Equipment.DISC in slot.equipment.enabled:
+                        elif Equipment.DISC in enabled_equipment:
 
                             # Just the Disc.  A couple valid states here
                             if args.prefer_disc_shrine_state:
-                                print(f'{slot_label}: Fixing Disc Quest State to Moved-to-shrine status.  (Specify --dont-fix-disc-state to disable this behavior.)')
+                                print(f'{label_prefix}Fixing Disc Quest State to Moved-to-shrine status.  (Specify --dont-fix-disc-state to disable this behavior.)')
                                 slot.quest_state.enable(QuestState.STATUE_NO_DISC)
                                 slot.quest_state.disable(QuestState.SHRINE_NO_DISC)
                             else:
-                                print(f'{slot_label}: Fixing Disc Quest State to initial swap status.  (Specify --dont-fix-disc-state to disable this behavior.)')
+                                print(f'{label_prefix}Fixing Disc Quest State to initial swap status.  (Specify --dont-fix-disc-state to disable this behavior.)')
                                 slot.quest_state.disable(QuestState.STATUE_NO_DISC)
                                 slot.quest_state.enable(QuestState.SHRINE_NO_DISC)
 
@@ -2450,7 +2529,7 @@ def main():
                             # after having the Mock Disc in the shrine.  We're going to
                             # ignore that possiblity, though, and just essentially
                             # revert to the game-start state.
-                            print(f'{slot_label}: Fixing Disc Quest State to game-start conditions.  (Specify --dont-fix-disc-state to disable this behavior.)')
+                            print(f'{label_prefix}Fixing Disc Quest State to game-start conditions.  (Specify --dont-fix-disc-state to disable this behavior.)')
                             slot.quest_state.disable(QuestState.STATUE_NO_DISC)
                             slot.quest_state.disable(QuestState.SHRINE_NO_DISC)
 
@@ -2458,38 +2537,33 @@ def main():
                     # want to allow the user to manually override our disc-related
                     # states.
                     if args.quest_state_disable:
-                        for quest_state in sorted(args.quest_state_disable):
-                            if quest_state in slot.quest_state.enabled:
-                                print(f'{slot_label}: Disabling quest state: {quest_state}')
-                                slot.quest_state.disable(quest_state)
-                                do_save = True
+                        to_disable = sorted(args.quest_state_disable & enabled_quest_states)
+                        for quest_state in to_disable:
+                            print(f'{label_prefix}Disabling quest state: {quest_state}')
+                        if to_disable:
+                            slot.quest_state.set_bits(disable_list=to_disable)
+                            do_save = True
 
                     if args.quest_state_enable:
-                        for quest_state in sorted(args.quest_state_enable):
-                            if quest_state not in slot.quest_state.enabled:
-                                print(f'{slot_label}: Enabling quest state: {quest_state}')
-                                slot.quest_state.enable(quest_state)
-                                do_save = True
+                        to_enable = sorted(args.quest_state_enable - enabled_quest_states)
+                        for quest_state in to_enable:
+                            print(f'{label_prefix}Enabling quest state: {quest_state}')
+                        if to_enable:
+                            slot.quest_state.set_bits(enable_list=to_enable)
+                            do_save = True
 
                 else:
                     # If we don't actually have any slot data, don't bother doing anything
                     if args.info:
-                        header = f'{slot_label}: No data!'
+                        header = f'{label_prefix}No data!'
                         print('')
                         print(header)
                         print('-'*len(header))
                     if do_slot_actions:
-                        print(f'{slot_label}: No data detected, so slot modifications skipped')
+                        print(f'{label_prefix}No data detected, so slot modifications skipped')
 
                 # Finally, if we've been told to export slot data, do so now
-                if args.export_slot:
-                    print(f'{slot_label}: Exporting slot data to: {args.export_slot}')
-                    if check_file_overwrite(args, args.export_slot):
-                        with open(args.export_slot, 'wb') as df:
-                            df.write(slot.export_data())
-                        print('Slot data exported!')
-                    else:
-                        print('NOTICE: Slot data NOT exported')
+                export_slot_data(args, slot, label_prefix)
 
         # Set frame seed
         if args.frame_seed is not None:
@@ -2499,18 +2573,20 @@ def main():
 
         # Process global unlockables
         if args.globals_disable:
-            for unlock in sorted(args.globals_disable):
-                if unlock in save.unlockables.enabled:
-                    print(f'Globals: Disabling global unlockable: {unlock}')
-                    save.unlockables.disable(unlock)
-                    do_save = True
+            to_disable = sorted(args.globals_disable & save.unlockables.enabled)
+            for unlock in to_disable:
+                print(f'Globals: Disabling global unlockable: {unlock}')
+            if to_disable:
+                save.unlockables.set_bits(disable_list=to_disable)
+                do_save = True
 
         if args.globals_enable:
-            for unlock in sorted(args.globals_enable):
-                if unlock not in save.unlockables.enabled:
-                    print(f'Globals: Enabling global unlockable: {unlock}')
-                    save.unlockables.enable(unlock)
-                    do_save = True
+            to_enable = sorted(args.globals_enable - save.unlockables.enabled)
+            for unlock in to_enable:
+                print(f'Globals: Enabling global unlockable: {unlock}')
+            if to_enable:
+                save.unlockables.set_bits(enable_list=to_enable)
+                do_save = True
 
         if args.info:
             print('')
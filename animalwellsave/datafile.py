@@ -16,10 +16,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>
 
-import os
 import sys
 import enum
 import struct
+import functools
 import collections
 
 from . import is_debug
@@ -31,11 +31,12 @@ from . import is_debug
 # specifying an absolute offset.  If passed in, the offset is expected to
 # be *relative* to the passed-in parent offset.
 #
-# The most questionable bit of the design (IMO) is that it currently walks
-# through an open filehandle as it goes, setting offsets based on current
-# position, and parsing the data as the structure's defined by the
-# implementing classes.  C'est la vie!  We are at least doing all that on
-# an in-memory `io.BytesIO` object, so whatever.
+# The most questionable bit of the design (IMO) is that it walks through
+# the data as it goes, setting offsets based on a shared "current position"
+# (see `Cursor`), and parsing the data as the structure's defined by the
+# implementing classes.  C'est la vie!  The data itself lives in an
+# in-memory buffer (an anonymous `mmap.mmap`, these days), and once a field's
+# offset has been worked out, it reads and writes directly at that offset.
 
 
 class Bounds(enum.Enum):
@@ -48,53 +49,118 @@ class Bounds(enum.Enum):
     UNSIGNED = enum.auto()
 
 
-# Low-level datatypes we'll be reading from the save file
-NumType = collections.namedtuple('NumType', ['num_bytes', 'struct_char', 'bounds'])
-UInt8 =  NumType(1, 'B', Bounds.UNSIGNED)
-Int8 =   NumType(1, 'b', Bounds.SIGNED)
-UInt16 = NumType(2, 'H', Bounds.UNSIGNED)
-Int16 =  NumType(2, 'h', Bounds.SIGNED)
-UInt32 = NumType(4, 'I', Bounds.UNSIGNED)
-Int32 =  NumType(4, 'i', Bounds.SIGNED)
-UInt64 = NumType(8, 'Q', Bounds.UNSIGNED)
-Int64 =  NumType(8, 'q', Bounds.SIGNED)
-Float =  NumType(4, 'f', Bounds.NONE)
-Double = NumType(8, 'd', Bounds.NONE)
+# Low-level datatypes we'll be reading from the save file.  Everything that
+# NumData needs to know about a type gets computed once here (by `_num_type`)
+# and lives on the NumType itself, rather than being recomputed (and stored)
+# for every single field in the file:
+#
+#   * `struct` is a precompiled `struct.Struct` for the type, so we're not
+#     re-parsing format strings for every field we read or write.  Integer
+#     types use these too, rather than `int.from_bytes()`/`int.to_bytes()`:
+#     reading straight out of our memoryview, unpack_from()/pack_into() come
+#     out well ahead (from_bytes has to slice out a new object first).
+#   * `bounds_check`, for integer types, is a `(min_value, mask)` tuple.
+#     Shifting a value down by the type's minimum means that it's in range if
+#     (and only if) none of the bits outside the type's width are set, so the
+#     check becomes a single AND.
+NumType = collections.namedtuple('NumType', [
+    'num_bytes', 'struct_char', 'bounds',
+    'min_value', 'max_value',
+    'struct', 'bounds_check',
+    ])
+
+
+def _num_type(num_bytes, struct_char, bounds):
+    """
+    Constructs a `NumType`, filling in the rest of the fields based on the
+    size, struct format character, and `bounds`.
+    """
+    match bounds:
+        case Bounds.SIGNED:
+            max_value = 2**((num_bytes*8)-1)-1
+            min_value = -(2**((num_bytes*8)-1))
+        case Bounds.UNSIGNED:
+            max_value = 2**(num_bytes*8)-1
+            min_value = 0
+        case _:
+            max_value = None
+            min_value = None
+    if min_value is None:
+        bounds_check = None
+    else:
+        bounds_check = (min_value, ~(max_value-min_value))
+    return NumType(num_bytes, struct_char, bounds,
+            min_value, max_value,
+            struct.Struct(f'<{struct_char}'), bounds_check,
+            )
+
+
+UInt8 =  _num_type(1, 'B', Bounds.UNSIGNED)
+Int8 =   _num_type(1, 'b', Bounds.SIGNED)
+UInt16 = _num_type(2, 'H', Bounds.UNSIGNED)
+Int16 =  _num_type(2, 'h', Bounds.SIGNED)
+UInt32 = _num_type(4, 'I', Bounds.UNSIGNED)
+Int32 =  _num_type(4, 'i', Bounds.SIGNED)
+UInt64 = _num_type(8, 'Q', Bounds.UNSIGNED)
+Int64 =  _num_type(8, 'q', Bounds.SIGNED)
+Float =  _num_type(4, 'f', Bounds.NONE)
+Double = _num_type(8, 'd', Bounds.NONE)
+
+
+class Cursor():
+    """
+    Keeps track of where we currently are while walking through the data, so
+    that fields defined in-line with each other know where they start.  A
+    single one of these gets shared by everything hanging off of the same
+    top-level object.
+    """
+
+    __slots__ = ('position',)
+
+    def __init__(self, position=0):
+        self.position = position
 
 
 class Data():
     """
     Base data class to handle knowing where the data is.  The `parent` object
     should have a file-like `df` attribute pointing to the currently open file.
-    (This is actually likely to be an in-memory `io.BytesIO` object.)  The
-    `parent` object should also have an `offset` attribute, though that's only
-    actually used if `offset` is passed in to here.  If no `offset` is passed
-    in, the position for this data element will be the current position of
-    the filehandle.
-
-    Note that the constructor will automatically seek to the start of the
-    data, after doing any offset computation, so that the data can then be
-    read by the implementing classes.
+    (This is actually likely to be an in-memory `mmap.mmap` object.)  It should
+    also have a `buf` attribute, which is a `memoryview` of that same data, for
+    direct access without going through the file-like interface, and a
+    `cursor` attribute (a `Cursor` object) which keeps track of our current
+    position while parsing.  The `parent` object should also have an `offset`
+    attribute, though that's only actually used if `offset` is passed in to
+    here.  If no `offset` is passed in, the position for this data element
+    will be the current position of the cursor.
+
+    Note that the constructor will automatically move the cursor to the start
+    of the data, after doing any offset computation, so that any in-line data
+    defined by the implementing classes will start in the right spot.
     """
 
+    __slots__ = ('debug_label', 'parent', '__indent', 'df', 'buf', 'cursor', 'offset')
+
     def __init__(self, debug_label, parent, /, offset=None):
         """
-        The `parent` object should have `df` (filehandle) and `offset`
-        attributes.  `offset`, if passed in, will be computed relative to
-        the parent's offset.  If not passed in, our offset will be the
-        current filehandle position.
+        The `parent` object should have `df` (filehandle), `buf` (memoryview),
+        `cursor`, and `offset` attributes.  `offset`, if passed in, will be
+        computed relative to the parent's offset.  If not passed in, our
+        offset will be the current cursor position.
         """
         self.debug_label = debug_label
         self.parent = parent
         self.__indent = None
         self.df = self.parent.df
+        self.buf = self.parent.buf
+        self.cursor = self.parent.cursor
         if offset is None:
-            self.offset = self.df.tell()
+            self.offset = self.cursor.position
         else:
             self.offset = offset
             if self.parent is not None:
                 self.offset += self.parent.offset
-            self.df.seek(self.offset, os.SEEK_SET)
+            self.cursor.position = self.offset
 
         # If we've been told to go into debug mode, show our offsets
         if is_debug():
@@ -146,46 +212,90 @@ class NumData(Data):
     count for the data type.
     """
 
-    def __init__(self, debug_label, parent, num_type, /, offset=None):
+    __slots__ = ('num_type', '_value')
+
+    def __init__(self, debug_label, parent, num_type, /, offset=None, *, value=None):
         """
-        The `parent` object should have `df` (filehandle) and `offset`
-        attributes.  `offset`, if passed in, will be computed relative to
-        the parent's offset.  If not passed in, our offset will be the
-        current filehandle position.
+        The `parent` object should have `df` (filehandle), `buf`, `cursor`,
+        and `offset` attributes.  `offset`, if passed in, will be computed
+        relative to the parent's offset.  If not passed in, our offset will
+        be the current cursor position.
 
         `num_type` should be a `NumType` structure.
+
+        `value` can be used to pass in a value which has already been read
+        from the file (see `bulk_read()`), in which case we won't bother
+        reading it ourselves.
         """
         super().__init__(debug_label, parent, offset=offset)
         self.num_type = num_type
-        self.struct_string = f'<{self.num_type.struct_char}'
-        match self.num_type.bounds:
-            case Bounds.SIGNED:
-                self.max_value = 2**((self.num_type.num_bytes*8)-1)-1
-                self.min_value = -(2**((self.num_type.num_bytes*8)-1))
-            case Bounds.UNSIGNED:
-                self.max_value = 2**(self.num_type.num_bytes*8)-1
-                self.min_value = 0
-            case _:
-                self.max_value = None
-                self.min_value = None
-        self._value = None
-
-        # Read in the values as we go.  This is probably inefficient for most
-        # use-cases 'cause there's unlikely to be a reason to read *everything*.
-        # It's handy for NumChoiceData and NumBitfieldData, though, so they can
-        # populate their extra fields immediately.  (We could, of course, only
-        # have *those* classes pre-load like this, or wrap their extra fields
-        # around properties to do the dynamic loading, but for now: whatever.)
-        self._value = struct.unpack(self.struct_string, self.df.read(self.num_type.num_bytes))[0]
+
+        # We used to read in every value as we went, which was inefficient for
+        # most use-cases 'cause there's unlikely to be a reason to read
+        # *everything*.  Now our `_value` slot is left empty until something
+        # actually asks for it, at which point `__getattr__` will read it in.
+        # NumChoiceData and NumBitfieldData end up loading immediately anyway,
+        # since their `_post_value_set` needs the value to populate their extra
+        # fields.
+        if value is not None:
+            self._value = value
+        self.cursor.position = self.offset+self.num_type.num_bytes
         self._post_value_set()
 
+    def __getattr__(self, name):
+        """
+        Only called when normal attribute lookup fails, which for `_value`
+        means we haven't read it in yet.  Do so now.
+        """
+        if name == '_value':
+            self._value = self.num_type.struct.unpack_from(self.buf, self.offset)[0]
+            return self._value
+        raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+
+    @classmethod
+    def bulk_read(cls, debug_label, parent, num_type, count, /, offset=None):
+        """
+        Reads in `count` consecutive values of the same `num_type`, returning
+        a list of NumData objects.  The whole lot is read and unpacked in a
+        single go, rather than one field at a time.  `offset` is handled the
+        same as for individual fields, and the cursor will be left just past
+        the last value.  Each object's debug label will be `debug_label`
+        with its index appended.
+        """
+        if offset is None:
+            start = parent.cursor.position
+        else:
+            start = parent.offset + offset
+        size = num_type.num_bytes
+        values = struct.unpack_from(f'<{count}{num_type.struct_char}', parent.buf, start)
+        items = []
+        for idx, value in enumerate(values):
+            items.append(cls(f'{debug_label} {idx}', parent, num_type,
+                offset=start-parent.offset+(idx*size),
+                value=value,
+                ))
+        parent.cursor.position = start+(size*count)
+        return items
+
+    @property
+    def min_value(self):
+        """
+        The minimum value we can hold (or `None` if we don't bounds-check)
+        """
+        return self.num_type.min_value
+
+    @property
+    def max_value(self):
+        """
+        The maximum value we can hold (or `None` if we don't bounds-check)
+        """
+        return self.num_type.max_value
+
     @property
     def value(self):
         """
-        Returns our raw value.
+        Returns our raw value (reading it in first, if need be).
         """
-        # In the future, we may want to dynamically load here, instead of
-        # doing so in the constructor.
         return self._value
 
     @value.setter
@@ -194,15 +304,30 @@ class NumData(Data):
         Sets our new value, potentially doing bounds checking at the same time.
         Will raise a `ValueError` if the bounds have been exceeded.
         """
-        if self.min_value is not None and new_value < self.min_value:
-            raise ValueError(f'Minimum value is {self.min_value}')
-        if self.max_value is not None and new_value > self.max_value:
-            raise ValueError(f'Maximum value is {self.max_value}')
-        self.df.seek(self.offset, os.SEEK_SET)
-        self.df.write(struct.pack(self.struct_string, new_value))
+        num_type = self.num_type
+        if num_type.bounds_check is not None \
+                and (new_value - num_type.bounds_check[0]) & num_type.bounds_check[1]:
+            if new_value < num_type.min_value:
+                raise ValueError(f'Minimum value is {num_type.min_value}')
+            else:
+                raise ValueError(f'Maximum value is {num_type.max_value}')
+        num_type.struct.pack_into(self.buf, self.offset, new_value)
         self._value = new_value
         self._post_value_set()
 
+    def reload(self):
+        """
+        Forgets our cached value, so that it'll be read in from the buffer again
+        the next time it's needed.  Only needed if something has written to our
+        data directly in the buffer, rather than going through `value`.
+        """
+        try:
+            del self._value
+        except AttributeError:
+            # Never loaded in the first place
+            pass
+        self._post_value_set()
+
     def _post_value_set(self):
         """
         Any actions which need to be performed after setting our value.  Empty for
@@ -230,76 +355,79 @@ class NumData(Data):
         """
         Support for using this class inside format strings.
         """
-        format_str = '{:' + format_str + '}'
-        return format_str.format(self.label)
+        return format(self.label, format_str)
 
     def __eq__(self, other):
         """
         Compare using our `value` attribute.  This should allow us to test for
         equality versus other `NumData` objects, or by raw numeric values.
         """
-        if issubclass(type(other), NumData):
-            return self.value == other.value
+        if isinstance(other, NumData):
+            return self._value == other._value
         else:
-            return self.value == other
+            return self._value == other
 
     def __lt__(self, other):
         """
         Compare using our `value` attribute.  This should allow us to test
         versus other `NumData` objects, or by raw numeric values.
         """
-        if issubclass(type(other), NumData):
-            return self.value < other.value
+        if isinstance(other, NumData):
+            return self._value < other._value
         else:
-            return self.value < other
+            return self._value < other
 
     def __gt__(self, other):
         """
         Compare using our `value` attribute.  This should allow us to test
         versus other `NumData` objects, or by raw numeric values.
         """
-        if issubclass(type(other), NumData):
-            return self.value > other.value
+        if isinstance(other, NumData):
+            return self._value > other._value
         else:
-            return self.value > other
+            return self._value > other
 
     def __le__(self, other):
         """
         Compare using our `value` attribute.  This should allow us to test
         versus other `NumData` objects, or by raw numeric values.
         """
-        if issubclass(type(other), NumData):
-            return self.value <= other.value
+        if isinstance(other, NumData):
+            return self._value <= other._value
         else:
-            return self.value <= other
+            return self._value <= other
 
     def __ge__(self, other):
         """
         Compare using our `value` attribute.  This should allow us to test
         versus other `NumData` objects, or by raw numeric values.
         """
-        if issubclass(type(other), NumData):
-            return self.value >= other.value
+        if isinstance(other, NumData):
+            return self._value >= other._value
         else:
-            return self.value >= other
+            return self._value >= other
 
     def __add__(self, other):
         """
         Support addition
         """
-        return self.value + other
+        return self._value + other
 
     def __sub__(self, other):
         """
         Support subtraction
         """
-        return self.value - other
+        return self._value - other
 
     def __mod__(self, other):
         """
         Support modulo
         """
-        return self.value % other
+        return self._value % other
+
+
+# Direct reference to NumData's `value` setter, for subclasses which wrap it
+_numdata_value_set = NumData.value.fset
 
 
 class LabelEnum(enum.Enum):
@@ -312,6 +440,8 @@ class LabelEnum(enum.Enum):
         obj = object.__new__(cls)
         obj._value_ = value
         obj.label = label
+        # Precompute the key we sort on, since labels never change
+        obj._sort_key = label.casefold()
         return obj
 
     def __lt__(self, other):
@@ -319,36 +449,36 @@ class LabelEnum(enum.Enum):
         Sort by our label
         """
         if type(other) == str:
-            return self.label.casefold() < other.casefold()
+            return self._sort_key < other.casefold()
         else:
-            return self.label.casefold() < other.label.casefold()
+            return self._sort_key < other._sort_key
 
     def __gt__(self, other):
         """
         Sort by our label
         """
         if type(other) == str:
-            return self.label.casefold() > other.casefold()
+            return self._sort_key > other.casefold()
         else:
-            return self.label.casefold() > other.label.casefold()
+            return self._sort_key > other._sort_key
 
     def __le__(self, other):
         """
         Sort by our label
         """
         if type(other) == str:
-            return self.label.casefold() <= other.casefold()
+            return self._sort_key <= other.casefold()
         else:
-            return self.label.casefold() <= other.label.casefold()
+            return self._sort_key <= other._sort_key
 
     def __ge__(self, other):
         """
         Sort by our label
         """
         if type(other) == str:
-            return self.label.casefold() >= other.casefold()
+            return self._sort_key >= other.casefold()
         else:
-            return self.label.casefold() >= other.label.casefold()
+            return self._sort_key >= other._sort_key
 
     def __str__(self):
         """
@@ -356,8 +486,88 @@ class LabelEnum(enum.Enum):
         """
         return self.label
 
-    def cli_arg_choices(self):
-        return sorted([e.name.lower() for e in self])
+    @classmethod
+    @functools.cache
+    def cli_arg_choices(cls):
+        """
+        Returns a sorted tuple of lowercased member names, suitable for using
+        as argparse choices.  This never changes, so we only compute it once.
+        """
+        return tuple(sorted([e.name.lower() for e in cls]))
+
+    @classmethod
+    @functools.cache
+    def bitfield_info(cls):
+        """
+        For enums used as bitfields: returns a `BitfieldInfo` structure with
+        some precomputed info about our members.  This lets the bitfield code
+        avoid walking the enum (and going through the `value` property) every
+        time a value gets updated.
+        """
+        known_mask = 0
+        bit_members = {}
+        zero_members = set()
+        nonzero_members = set()
+        for choice in cls:
+            known_mask |= choice.value
+            if choice.value == 0:
+                zero_members.add(choice)
+            else:
+                nonzero_members.add(choice)
+            bit_members[choice.value] = choice
+        if any(mask & (mask-1) for mask in bit_members) or len(bit_members) != len(cls):
+            # Multi-bit masks or aliases mean we can't map single bits
+            # straight to members
+            bit_members = None
+        return BitfieldInfo(
+                tuple((choice.value, choice) for choice in cls),
+                known_mask,
+                bit_members,
+                frozenset(zero_members),
+                frozenset(nonzero_members),
+                )
+
+
+# Precomputed information about a bitfield enum; see `LabelEnum.bitfield_info()`.
+#   items: tuple of `(mask, member)` pairs for all members
+#   known_mask: all member masks combined
+#   bit_members: dict of mask to member, if every member is a single distinct
+#       bit (otherwise `None`)
+#   zero_members/nonzero_members: frozensets of members whose mask is (or
+#       isn't) zero
+BitfieldInfo = collections.namedtuple('BitfieldInfo', [
+    'items',
+    'known_mask',
+    'bit_members',
+    'zero_members',
+    'nonzero_members',
+    ])
+_EMPTY_BITFIELD_INFO = BitfieldInfo((), 0, None, frozenset(), frozenset())
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_bitfield(bitfield, enabled_mask):
+    """
+    Splits the members of the `bitfield` LabelEnum into a pair of frozensets:
+    those which are enabled by `enabled_mask`, and those which aren't.  This
+    is cached, since the same values tend to show up over and over (empty
+    slots, completed collections, re-loading the same file, etc).
+    """
+    if bitfield is None:
+        return frozenset(), frozenset()
+    info = bitfield.bitfield_info()
+    enabled = set(info.zero_members)
+    bit_members = info.bit_members
+    if bit_members is not None:
+        while enabled_mask:
+            bit = enabled_mask & -enabled_mask
+            enabled_mask ^= bit
+            enabled.add(bit_members[bit])
+    else:
+        for mask, choice in info.items:
+            if mask and enabled_mask & mask == mask:
+                enabled.add(choice)
+    return frozenset(enabled), info.nonzero_members - enabled
 
 
 class NumChoiceData(NumData):
@@ -375,22 +585,27 @@ class NumChoiceData(NumData):
     whether to allow that kind of thing or not, instead of just allowing?)
     """
 
-    def __init__(self, debug_label, parent, num_type, choices, /, offset=None):
+    __slots__ = ('choices', 'choice')
+
+    def __init__(self, debug_label, parent, num_type, choices, /, offset=None, *, value=None):
         """
-        The `parent` object should have `df` (filehandle) and `offset`
-        attributes.  `offset`, if passed in, will be computed relative to
-        the parent's offset.  If not passed in, our offset will be the
-        current filehandle position.
+        The `parent` object should have `df` (filehandle), `buf`, `cursor`,
+        and `offset` attributes.  `offset`, if passed in, will be computed
+        relative to the parent's offset.  If not passed in, our offset will
+        be the current cursor position.
 
         `num_type` should be a `NumType` structure.
 
         `choices` should be a `LabelEnum` class, defining the known values
         for this data.
+
+        `value`, as with `NumData`, can be used to pass in an already-read
+        value.
         """
 
         self.choices = choices
         self.choice = None
-        super().__init__(debug_label, parent, num_type, offset=offset)
+        super().__init__(debug_label, parent, num_type, offset=offset, value=value)
 
     @NumData.value.setter
     def value(self, new_value):
@@ -399,14 +614,18 @@ class NumChoiceData(NumData):
         an instance of `self.choices`.
         """
         if isinstance(new_value, self.choices):
-            new_value = new_value.value
-        # Okay this syntax is a bit wild.  Really `super().value = new_value`
-        # should do the trick, but it doesn't: https://github.com/python/cpython/issues/59170
+            # `_value_` rather than `value`, since the latter goes through
+            # Enum's property machinery and is an order of magnitude slower.
+            new_value = new_value._value_
+        # Really `super().value = new_value` should do the trick here, but it
+        # doesn't: https://github.com/python/cpython/issues/59170
         # Other reading:
         #    https://medium.com/@nurettinabaci/python-property-and-inheritance-fa9143201c17
         #    https://gist.github.com/Susensio/979259559e2bebcd0273f1a95d7c1e79
         #    https://github.com/python/cpython/blob/0abf997e75bd3a8b76d920d33cc64d5e6c2d380f/Lib/ssl.py#L546
-        super(NumChoiceData, NumChoiceData).value.fset(self, new_value)
+        # Rather than doing the `super(...).value.fset` dance on every write, we
+        # just call a reference to NumData's setter which we grabbed up-front.
+        _numdata_value_set(self, new_value)
 
     def _post_value_set(self):
         """
@@ -417,11 +636,14 @@ class NumChoiceData(NumData):
             # In Python 3.12 we could check `self.value in self.choices`, as I was doing
             # originally, but it turns out that's something added in 3.12, and I'd like
             # to be compatible back to 3.10.  See: https://github.com/python/cpython/issues/88123
-            # (not that this method is bad, of course -- more Pythonic, even, probably!)
-            try:
-                self.choice = self.choices(self.value)
-            except ValueError:
-                self.choice = None
+            # For a while this called `self.choices(self.value)` and caught the
+            # ValueError, but Enum already keeps a value-to-member dict around, so
+            # we may as well just look the value up in there directly.  None of our
+            # enums define `_missing_`, so we're not losing anything by skipping
+            # the constructor.  (I'd also tried a value-indexed tuple for our
+            # densely-numbered enums, but with the bounds check that needs, it
+            # came out slightly *slower* than this dict lookup.)
+            self.choice = self.choices._value2member_map_.get(self._value)
 
     @property
     def label(self):
@@ -441,12 +663,12 @@ class NumChoiceData(NumData):
         equality versus other `NumData` objects, by `LabelEnum` value, or by
         raw numeric values.
         """
-        if issubclass(type(other), NumData):
-            return self.value == other.value
-        elif issubclass(type(other), LabelEnum):
-            return self.value == other.value
+        if isinstance(other, NumData):
+            return self._value == other._value
+        elif isinstance(other, LabelEnum):
+            return self._value == other._value_
         else:
-            return self.value == other
+            return self._value == other
 
 
 class NumBitfieldData(NumData):
@@ -461,15 +683,23 @@ class NumBitfieldData(NumData):
 
     In addition to an `enabled` set which can be used to enumerate
     enabled items, the class keeps track of a `disabled` set to do
-    the opposite.
+    the opposite.  `enabled_mask` holds the same information as `enabled`
+    but as an integer (ie: our value with any unknown bits masked off),
+    for when bitwise tests are more convenient.
     """
 
+    __slots__ = (
+            'bitfield', '_info', '_known_mask',
+            'enabled_mask', 'enabled', 'disabled',
+            '_sorted_enabled', '_sorted_disabled',
+            )
+
     def __init__(self, debug_label, parent, num_type, bitfield, /, offset=None):
         """
-        The `parent` object should have `df` (filehandle) and `offset`
-        attributes.  `offset`, if passed in, will be computed relative to
-        the parent's offset.  If not passed in, our offset will be the
-        current filehandle position.
+        The `parent` object should have `df` (filehandle), `buf`, `cursor`,
+        and `offset` attributes.  `offset`, if passed in, will be computed
+        relative to the parent's offset.  If not passed in, our offset will
+        be the current cursor position.
 
         `num_type` should be a `NumType` structure.
 
@@ -477,8 +707,18 @@ class NumBitfieldData(NumData):
         for this data.
         """
         self.bitfield = bitfield
+        if self.bitfield is None:
+            self._info = _EMPTY_BITFIELD_INFO
+        else:
+            self._info = self.bitfield.bitfield_info()
+        self._known_mask = self._info.known_mask
+
+        # These get populated by `_post_value_set` once our value's been read
+        self.enabled_mask = None
         self.enabled = set()
         self.disabled = set()
+        self._sorted_enabled = None
+        self._sorted_disabled = None
         super().__init__(debug_label, parent, num_type, offset=offset)
 
     def _post_value_set(self):
@@ -486,15 +726,71 @@ class NumBitfieldData(NumData):
         Called after our value is set, and will populate our `self.enabled`
         set which contains `self.bitfield` members describing what options
         are currently enabled.
-        """
-        self.enabled = set()
-        self.disabled = set()
-        if self.bitfield is not None:
-            for choice in self.bitfield:
-                if self._value & choice.value == choice.value:
+
+        The sets are updated in-place rather than replaced, so callers can
+        hang on to a reference to `enabled`/`disabled` and have it stay
+        current across edits.  We only touch the sets for members whose bits
+        have actually changed, and don't bother doing anything at all if none
+        of our known bits have.
+        """
+        enabled_mask = self._value & self._known_mask
+        if self.enabled_mask is None:
+            # First time through, so populate our sets from scratch (using the
+            # cached split for this value, if we've seen it before).
+            self.enabled_mask = enabled_mask
+            enabled, disabled = _split_bitfield(self.bitfield, enabled_mask)
+            self.enabled.update(enabled)
+            self.disabled.update(disabled)
+            return
+        changed = enabled_mask ^ self.enabled_mask
+        if not changed:
+            return
+        self.enabled_mask = enabled_mask
+        self._sorted_enabled = None
+        self._sorted_disabled = None
+        bit_members = self._info.bit_members
+        if bit_members is not None:
+            # Every member is a single bit, so we can just walk the bits which
+            # have changed (lowest first), rather than the whole enum.
+            while changed:
+                bit = changed & -changed
+                changed ^= bit
+                choice = bit_members[bit]
+                if enabled_mask & bit:
+                    self.disabled.discard(choice)
                     self.enabled.add(choice)
                 else:
+                    self.enabled.discard(choice)
                     self.disabled.add(choice)
+        else:
+            for mask, choice in self._info.items:
+                if mask & changed:
+                    if enabled_mask & mask == mask:
+                        self.disabled.discard(choice)
+                        self.enabled.add(choice)
+                    else:
+                        self.enabled.discard(choice)
+                        self.disabled.add(choice)
+
+    @property
+    def sorted_enabled(self):
+        """
+        Returns a sorted tuple of our `enabled` set.  This is cached until the
+        next time our value changes.
+        """
+        if self._sorted_enabled is None:
+            self._sorted_enabled = tuple(sorted(self.enabled))
+        return self._sorted_enabled
+
+    @property
+    def sorted_disabled(self):
+        """
+        Returns a sorted tuple of our `disabled` set.  This is cached until the
+        next time our value changes.
+        """
+        if self._sorted_disabled is None:
+            self._sorted_disabled = tuple(sorted(self.disabled))
+        return self._sorted_disabled
 
     def __len__(self):
         """
@@ -508,19 +804,63 @@ class NumBitfieldData(NumData):
         """
         return len(self.bitfield)
 
+    def __int__(self):
+        """
+        Returns our raw integer value, for callers who'd rather do their own
+        bitwise tests against it.
+        """
+        return self._value
+
+    def has(self, choice):
+        """
+        Returns `True` if the specified bit is enabled in the bitfield.
+        `choice` can either be an instance of the `LabelEnum` applied to the
+        field, or the numeric bit mask.  This is a straight bitwise test
+        against our value, so it's cheaper than checking membership in
+        `enabled` when you're only interested in one or two bits.
+        """
+        mask = self._choice_mask(choice)
+        return self._value & mask == mask
+
+    def _choice_mask(self, choice):
+        """
+        Returns the bitmask for `choice`, which can either be an instance of
+        our `LabelEnum` or the numeric bit mask itself.  Raises a `ValueError`
+        if the mask isn't one we know about.  This avoids going through the
+        enum's constructor (and `value` property) for the lookup.
+        """
+        if isinstance(choice, self.bitfield):
+            return choice._value_
+        if choice in self.bitfield._value2member_map_:
+            return choice
+        raise ValueError(f'{choice!r} is not a valid {self.bitfield.__qualname__}')
+
+    def set_bits(self, enable_list=(), disable_list=()):
+        """
+        Enables all the bits in `enable_list`, and disables all the bits in
+        `disable_list`, writing out the new value just once at the end (and
+        not at all, if nothing actually changed).  Items in either list can
+        either be instances of the `LabelEnum` applied to the field, or the
+        numeric bit mask.  Will raise a `ValueError` if a bitmask is passed
+        in which is not a part of the LabelEnum.
+        """
+        new_value = self.value
+        for choice in enable_list:
+            new_value |= self._choice_mask(choice)
+        for choice in disable_list:
+            new_value &= ~self._choice_mask(choice)
+        if new_value != self.value:
+            self.value = new_value
+
     def enable(self, choice):
         """
         Enables the specified bit within the bitfield.  `choice` can either be
         an instance of the `LabelEnum` applied to the field, or the numeric
         bit mask.  Will raise a `ValueError` if a bitmask is passed in which
-        is not a part of the LabelEnum.
+        is not a part of the LabelEnum.  If you're setting a bunch of bits in
+        a row, `set_bits` will be more efficient.
         """
-        # TODO: this is pretty stupidly inefficient, especially if you're
-        # setting a bunch of bitfields in a row.
-        if not isinstance(choice, self.bitfield):
-            choice = self.bitfield(choice)
-        if choice not in self.enabled:
-            self.value = self.value | choice.value
+        self.set_bits(enable_list=(choice,))
 
     def enable_all(self):
         """
@@ -528,24 +868,17 @@ class NumBitfieldData(NumData):
         *all* bits on in case our bitfield mapping is incomplete -- we don't
         want to alter data we don't know about.
         """
-        new_value = self.value
-        for item in self.bitfield:
-            new_value |= item.value
-        self.value = new_value
+        self.value = self.value | self._known_mask
 
     def disable(self, choice):
         """
         Disables the specified bit within the bitfield.  `choice` can either be
         an instance of the `LabelEnum` applied to the field, or the numeric
         bit mask.  Will raise a `ValueError` if a bitmask is passed in which
-        is not a part of the LabelEnum.
+        is not a part of the LabelEnum.  If you're clearing a bunch of bits
+        in a row, `set_bits` will be more efficient.
         """
-        # TODO: this is pretty stupidly inefficient, especially if you're
-        # setting a bunch of bitfields in a row.
-        if not isinstance(choice, self.bitfield):
-            choice = self.bitfield(choice)
-        if choice in self.enabled:
-            self.value = self.value & ~choice.value
+        self.set_bits(disable_list=(choice,))
 
     def disable_all(self):
         """
@@ -553,10 +886,7 @@ class NumBitfieldData(NumData):
         *all* bits off in case our bitfield mapping is incomplete -- we don't
         want to alter data we don't know about.
         """
-        new_value = self.value
-        for item in self.bitfield:
-            new_value &= ~item.value
-        self.value = new_value
+        self.value = self.value & ~self._known_mask
 
 
 class BitCountData(Data):
@@ -580,10 +910,10 @@ class BitCountData(Data):
 
     def __init__(self, debug_label, parent, num_type, count, max_bits, offset=None):
         """
-        The `parent` object should have `df` (filehandle) and `offset`
-        attributes.  `offset`, if passed in, will be computed relative to
-        the parent's offset.  If not passed in, our offset will be the
-        current filehandle position.
+        The `parent` object should have `df` (filehandle), `buf`, `cursor`,
+        and `offset` attributes.  `offset`, if passed in, will be computed
+        relative to the parent's offset.  If not passed in, our offset will
+        be the current cursor position.
 
         `num_type` should be a `NumType` structure, and `count` should be
         the number of those structures which make up the bitfield.  `max_bits`
@@ -600,9 +930,7 @@ class BitCountData(Data):
         self.max_bits = max_bits
 
         # Read in data
-        self._data = []
-        for idx in range(self._data_count):
-            self._data.append(NumData(f'Segment {idx}', self, self.num_type))
+        self._data = NumData.bulk_read('Segment', self, self.num_type, self._data_count)
         self._fix_count()
 
     def __str__(self):
@@ -630,11 +958,12 @@ class BitCountData(Data):
     def _fix_count(self):
         """
         Resets our internal `count` structure for how many bits are set across
-        the entire data length.
+        the entire data length.  Rather than counting each segment separately,
+        we treat the whole region as one big integer so it's a single
+        `bit_count()` call.
         """
-        self.count = 0
-        for data in self._data:
-            self.count += data.value.bit_count()
+        end = self.offset + self._data_count*self.num_type.num_bytes
+        self.count = int.from_bytes(self.buf[self.offset:end], 'little').bit_count()
 
     def _set_all(self, value):
         """
@@ -681,12 +1010,13 @@ class BitCountData(Data):
         """
         if bit >= self.max_bits:
             raise ValueError(f'Cannot alter bit {bit}; only {self.max_bits} are used')
-        bits_per_segment = self.num_type.num_bytes*8
-        segment = int(bit/bits_per_segment)
-        bit -= bits_per_segment*segment
+        segment, bit = divmod(bit, self.num_type.num_bytes*8)
+        data = self._data[segment]
         mask = 1<<bit
-        self._data[segment].value |= mask
-        self._fix_count()
+        # Only one bit can change, so just adjust our count directly
+        if not data.value & mask:
+            data.value |= mask
+            self.count += 1
 
     def clear_bit(self, bit):
         """
@@ -697,10 +1027,11 @@ class BitCountData(Data):
         """
         if bit >= self.max_bits:
             raise ValueError(f'Cannot alter bit {bit}; only {self.max_bits} are used')
-        bits_per_segment = self.num_type.num_bytes*8
-        segment = int(bit/bits_per_segment)
-        bit -= bits_per_segment*segment
+        segment, bit = divmod(bit, self.num_type.num_bytes*8)
+        data = self._data[segment]
         mask = 1<<bit
-        self._data[segment].value &= ~mask
-        self._fix_count()
+        # Only one bit can change, so just adjust our count directly
+        if data.value & mask:
+            data.value &= ~mask
+            self.count -= 1
 
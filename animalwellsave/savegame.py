@@ -17,14 +17,18 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>
 
 import os
-import io
 import sys
+import mmap
 import enum
+import shutil
 import struct
+import tempfile
+import functools
 import collections
 
+from . import is_debug
 from .datafile import UInt8, UInt16, UInt32, UInt64, Float, \
-        Data, NumData, \
+        Cursor, Data, NumData, \
         NumChoiceData, NumBitfieldData, BitCountData, \
         LabelEnum
 
@@ -512,26 +516,27 @@ class Timestamp(Data):
     each slot, and shown on the "load game" dialog in-game.
     """
 
+    __slots__ = ('year', 'month', 'day', 'hour', 'minute', 'second', 'has_data')
+
+    # We always need all of these values right away (to check for an empty
+    # slot), so read them all in with a single unpack.
+    STRUCT = struct.Struct('<HBBBBB')
+    TOTAL_BYTES = STRUCT.size
+
     def __init__(self, debug_label, parent, offset=None):
         super().__init__(debug_label, parent, offset=offset)
 
         # Data
-        self.year = NumData('Year', self, UInt16)
-        self.month = NumData('Month', self, UInt8)
-        self.day = NumData('Day', self, UInt8)
-        self.hour = NumData('Hour', self, UInt8)
-        self.minute = NumData('Minute', self, UInt8)
-        self.second = NumData('Second', self, UInt8)
+        year, month, day, hour, minute, second = Timestamp.STRUCT.unpack_from(self.buf, self.offset)
+        self.year = NumData('Year', self, UInt16, value=year)
+        self.month = NumData('Month', self, UInt8, value=month)
+        self.day = NumData('Day', self, UInt8, value=day)
+        self.hour = NumData('Hour', self, UInt8, value=hour)
+        self.minute = NumData('Minute', self, UInt8, value=minute)
+        self.second = NumData('Second', self, UInt8, value=second)
 
         # If all fields are zero, assume that the slot is empty
-        self.has_data = any([
-            self.year.value != 0,
-            self.month.value != 0,
-            self.day.value != 0,
-            self.hour.value != 0,
-            self.minute.value != 0,
-            self.second.value != 0,
-            ])
+        self.has_data = bool(year or month or day or hour or minute or second)
 
     def __str__(self):
         return f'{self.year:04d}-{self.month:02d}-{self.day:02d} {self.hour:02d}:{self.minute:02d}:{self.second:02d}'
@@ -544,6 +549,8 @@ class Flame(NumChoiceData):
     being used, when iterating over the whole set.
     """
 
+    __slots__ = ('name',)
+
     def __init__(self, debug_label, parent, offset=None):
         super().__init__(debug_label, parent, UInt8, FlameState)
         self.name = self.debug_label
@@ -556,6 +563,17 @@ class Flames(Data):
     single-letter attributes.
     """
 
+    __slots__ = ('b', 'p', 'v', 'g', 'flames')
+
+    # Index into `flames` for each letter.  This is the same for every slot,
+    # so there's no need for each instance to build its own lookup dict.
+    LETTER_INDEX = {
+            'b': 0,
+            'p': 1,
+            'v': 2,
+            'g': 3,
+            }
+
     def __init__(self, debug_label, parent, offset=None):
         super().__init__(debug_label, parent, offset=offset)
 
@@ -565,13 +583,7 @@ class Flames(Data):
         self.v = Flame('V. Flame', self)
         self.g = Flame('G. Flame', self)
 
-        self.flames = [self.b, self.p, self.v, self.g]
-        self._by_letter = {
-                'b': self.b,
-                'p': self.p,
-                'v': self.v,
-                'g': self.g,
-                }
+        self.flames = (self.b, self.p, self.v, self.g)
 
     def __iter__(self):
         """
@@ -584,7 +596,7 @@ class Flames(Data):
         Can also lookup flames by lowercase letter (mostly just to support
         the CLI util a bit more easily)
         """
-        return self._by_letter[key]
+        return self.flames[Flames.LETTER_INDEX[key]]
 
 
 class Ticks(NumData):
@@ -600,29 +612,40 @@ class Ticks(NumData):
     Datawise this is just a UInt32.
     """
 
+    __slots__ = ()
+
     def __init__(self, debug_label, parent, offset=None):
         super().__init__(debug_label, parent, UInt32, offset=offset)
-        self._last_string = None
-        self._stringval = None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _format_ticks(value):
+        """
+        Formats a tick count in the same format as the game itself.  This is
+        cached at the class level, so all our Ticks objects (and repeated
+        calls on the same one) share the computed strings.
+        """
+        # Plain `%` and `//` turn out to be a bit quicker than a chain of
+        # `divmod()`s, since there's no tuple to build and unpack each time.
+        ticks = value % 60
+        value //= 60
+        seconds = value % 60
+        value //= 60
+        minutes = value % 60
+        hours = value // 60
+        return f'{hours:d}:{minutes:02d}:{seconds:02d}:{ticks:02d}'
 
     def __str__(self):
         """
         Report the delta in the same format as the game itself
         """
-        if self.value != self._last_string:
-            self._last_string = self.value
-            seconds, ticks = divmod(self.value, 60)
-            minutes, seconds = divmod(seconds, 60)
-            hours, minutes = divmod(minutes, 60)
-            self._stringval = f'{hours:d}:{minutes:02d}:{seconds:02d}:{ticks:02d}'
-        return self._stringval
+        return Ticks._format_ticks(self._value)
 
     def __format__(self, format_str):
         """
         Format using our string representation instead of raw numeric data
         """
-        format_str = '{:' + format_str + '}'
-        return format_str.format(str(self))
+        return format(str(self), format_str)
 
 
 class MapCoord(Data):
@@ -635,17 +658,25 @@ class MapCoord(Data):
     coordinate is (2, 4).
     """
 
+    __slots__ = ('x', 'y')
+
+    # Used to read both coordinates at once
+    STRUCT = struct.Struct('<II')
+
     def __init__(self, debug_label, parent, offset=None):
         super().__init__(debug_label, parent, offset=offset)
 
-        self.x = NumData('X', self, UInt32)
-        self.y = NumData('Y', self, UInt32)
+        x, y = MapCoord.STRUCT.unpack_from(self.buf, self.offset)
+        self.x = NumData('X', self, UInt32, value=x)
+        self.y = NumData('Y', self, UInt32, value=y)
 
     def __str__(self):
         """
-        String representation should be the full coordinate tuple
+        String representation should be the full coordinate tuple.  We read
+        both values straight out of the buffer in one go, rather than going
+        through each field's formatting.
         """
-        return f'({self.x}, {self.y})'
+        return '({}, {})'.format(*MapCoord.STRUCT.unpack_from(self.buf, self.offset))
 
 
 class Minimap(Data):
@@ -656,6 +687,8 @@ class Minimap(Data):
     of data; the minimum resolution they work with is really whole rooms.
     """
 
+    __slots__ = ()
+
     # Room dimensions in pixels
     ROOM_W = 40
     ROOM_H = 22
@@ -680,7 +713,7 @@ class Minimap(Data):
 
         # Subsequent data might rely on us having seeked to the end of the
         # data, so do so now.
-        self.df.seek(Minimap.MAP_BYTE_TOTAL, os.SEEK_CUR)
+        self.cursor.position += Minimap.MAP_BYTE_TOTAL
 
     def room_start_offset(self, x, y):
         """
@@ -689,26 +722,43 @@ class Minimap(Data):
         """
         return self.offset + y*Minimap.MAP_BYTE_ROOM_H + (x*Minimap.ROOM_BYTE_W)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _fill_data(fill_byte, length):
+        """
+        Returns `fill_byte` repeated out to `length` bytes.  In practice we only
+        ever fill with a couple of different bytes in a couple of different
+        shapes, so these get cached rather than rebuilt on every fill (the
+        full-map one is over 50KB).  Since this is cached, `fill_byte` must be
+        hashable; callers should convert it with `bytes()` first.
+        """
+        return fill_byte * length
+
     def _inner_fill(self, initial_location, row_fill, num_pixel_rows):
         """
         Inner function to assist in filling areas of the map.  `initial_location`
         should be the upper-left corner of where to fill.  `row_fill` is the data
         that will be written into each row.  `num_pixel_rows` is the number of
         rows to fill in.
+
+        Each row is written separately so that the data in between is left
+        alone.  (That's just a memoryview slice-assignment per row; I'd tried
+        doing strided per-column assignments instead, but those turned out to
+        be several times slower.)
         """
-        skip_size = Minimap.MAP_BYTE_W - len(row_fill)
-        self.df.seek(initial_location)
-        for _ in range(num_pixel_rows):
-            self.df.write(row_fill)
-            self.df.seek(skip_size, os.SEEK_CUR)
+        row_len = len(row_fill)
+        buf = self.buf
+        end = initial_location + num_pixel_rows*Minimap.MAP_BYTE_W
+        for position in range(initial_location, end, Minimap.MAP_BYTE_W):
+            buf[position:position+row_len] = row_fill
 
     def fill_room(self, x, y, fill_byte=b'\xFF'):
         """
-        Fills in the specified room.
+        Fills in the specified room.  `fill_byte` can be any bytes-like object.
         """
         self._inner_fill(
                 self.room_start_offset(x, y),
-                fill_byte * Minimap.ROOM_BYTE_W,
+                Minimap._fill_data(bytes(fill_byte), Minimap.ROOM_BYTE_W),
                 Minimap.ROOM_H,
                 )
 
@@ -722,17 +772,20 @@ class Minimap(Data):
         """
         Fills in the entire map.  If `playable_only` is `True`, this will be limited
         to the inner playable area.  If `False`, even the outer padding areas
-        will be filled.
+        will be filled.  `fill_byte` can be any bytes-like object.
         """
+        # `_fill_data` is cached, so it needs a hashable `bytes` to work with
+        fill_byte = bytes(fill_byte)
         if playable_only:
-            initial_location = self.room_start_offset(*Minimap.MAP_PLAYABLE_ROOM_START)
-            row_fill = fill_byte * Minimap.ROOM_BYTE_W * Minimap.MAP_PLAYABLE_ROOM_W
-            num_pixel_rows = Minimap.ROOM_H * Minimap.MAP_PLAYABLE_ROOM_H
+            self._inner_fill(
+                    self.room_start_offset(*Minimap.MAP_PLAYABLE_ROOM_START),
+                    Minimap._fill_data(fill_byte, Minimap.MAP_PLAYABLE_BYTE_W),
+                    Minimap.ROOM_H * Minimap.MAP_PLAYABLE_ROOM_H,
+                    )
         else:
-            initial_location = self.room_start_offset(0, 0)
-            row_fill = fill_byte * Minimap.ROOM_BYTE_W * Minimap.MAP_ROOM_W
-            num_pixel_rows = Minimap.ROOM_H * Minimap.MAP_ROOM_H
-        self._inner_fill(initial_location, row_fill, num_pixel_rows)
+            # The full map is one contiguous chunk of data, so there's no need
+            # to go row-by-row; just write the whole thing in one go.
+            self.buf[self.offset:self.offset+Minimap.MAP_BYTE_TOTAL] = Minimap._fill_data(fill_byte, Minimap.MAP_BYTE_TOTAL)
 
     def clear_map(self, playable_only=True):
         """
@@ -785,29 +838,23 @@ class Minimap(Data):
         if im.mode != '1':
             im = im.convert('1', dither=Image.Dither.FLOYDSTEINBERG)
 
-        # Now do the import.
-        # TODO: This is probably the least-efficient and terrible way to do this
-        self.df.seek(self.offset+start)
-        for y in range(im.height):
-            x = 0
-            for x0 in range(int(im.width/8)):
-                byte = 0
-                x += 8
-                for idx in range(8):
-                    x -= 1
-                    pixel = im.getpixel((x, y))
-                    if pixel > 0:
-                        pixel = 1
-                    if invert:
-                        if pixel == 1:
-                            pixel = 0
-                        else:
-                            pixel = 1
-                    byte <<= 1
-                    byte |= pixel
-                x += 8
-                self.df.write(struct.pack('<B', byte))
-            self.df.seek(row_skip, os.SEEK_CUR)
+        # Now do the import.  The minimap stores its leftmost pixel in the
+        # lowest bit of each byte, which happens to be exactly what Pillow's
+        # "1;R" raw mode gives us (and "1;IR" is the same thing, inverted), so
+        # we can have Pillow pack the whole image for us in one go.
+        if invert:
+            raw_mode = '1;IR'
+        else:
+            raw_mode = '1;R'
+        raw_data = im.tobytes('raw', raw_mode)
+        position = self.offset+start
+        if row_skip == 0:
+            self.buf[position:position+len(raw_data)] = raw_data
+        else:
+            row_bytes = dim_x//8
+            for row_start in range(0, len(raw_data), row_bytes):
+                self.buf[position:position+row_bytes] = raw_data[row_start:row_start+row_bytes]
+                position += row_bytes + row_skip
 
     def export_image(self, filename):
         """
@@ -819,18 +866,15 @@ class Minimap(Data):
         global has_image_support
         if not has_image_support:
             raise RuntimeError('Pillow module does not seem to be available; export_image is not usable')
-        self.df.seek(self.offset)
-        raw_data = self.df.read(Minimap.MAP_BYTE_TOTAL)
-        new_data = []
-        for byte in raw_data:
-            for _ in range(8):
-                new_data.append(byte & 0x1)
-                byte >>= 1
-        im = Image.new(
+        # As with `import_image`, Pillow's "1;R" raw mode matches how the
+        # minimap stores its pixels, so Pillow can unpack it all directly.
+        im = Image.frombytes(
                 '1',
                 (Minimap.ROOM_W*Minimap.MAP_ROOM_W, Minimap.ROOM_H*Minimap.MAP_ROOM_H),
+                bytes(self.buf[self.offset:self.offset+Minimap.MAP_BYTE_TOTAL]),
+                'raw',
+                '1;R',
                 )
-        im.putdata(new_data)
         im.save(filename)
 
 
@@ -840,13 +884,20 @@ class Stamp(Data):
     Holds information about a single minimap stamp.
     """
 
+    __slots__ = ('x', 'y', 'icon')
+
+    # X, Y, and Icon are all UInt16s, and we read them all in one go
+    STRUCT = struct.Struct('<HHH')
+    TOTAL_BYTES = STRUCT.size
+
     def __init__(self, debug_label, parent, offset=None):
         super().__init__(debug_label, parent, offset=offset)
 
         # Data
-        self.x = NumData('X Pos', self, UInt16)
-        self.y = NumData('Y Pos', self, UInt16)
-        self.icon = NumChoiceData('Icon', self, UInt16, StampIcon)
+        x, y, icon = Stamp.STRUCT.unpack_from(self.buf, self.offset)
+        self.x = NumData('X Pos', self, UInt16, value=x)
+        self.y = NumData('Y Pos', self, UInt16, value=y)
+        self.icon = NumChoiceData('Icon', self, UInt16, StampIcon, value=icon)
 
     def __str__(self):
         return f'{self.icon} at ({self.x}, {self.y})'
@@ -859,6 +910,14 @@ class Stamp(Data):
         self.y.value = 0
         self.icon.value = 0
 
+    def reload(self):
+        """
+        Re-reads our data from the buffer, after it's been altered directly.
+        """
+        self.x.reload()
+        self.y.reload()
+        self.icon.reload()
+
     def copy_from(self, other):
         """
         Copies data from another Stamp into ourselves (used when deleting)
@@ -872,17 +931,45 @@ class Stamps(Data):
     """
     Holds information about map stamps on the minimap, and provides some
     management functions.
+
+    Note that as with all our other data, stamp edits are written straight
+    into the savegame buffer as they happen -- there's no separate copy of
+    the stamp data which needs to get written back out when saving.
     """
 
+    __slots__ = ('_num_stamps', 'selected_icon', '_stamps_start', '_stamps')
+
+    MAX_STAMPS = 64
+
     def __init__(self, debug_label, parent, offset=None):
         super().__init__(debug_label, parent, offset=offset)
 
         # Data
         self._num_stamps = NumData('Num Stamps', self, UInt8)
         self.selected_icon = NumChoiceData('Selected Icon', self, UInt16, StampIcon)
-        self._stamps = []
-        for idx in range(64):
-            self._stamps.append(Stamp(f'Stamp {idx}', self))
+
+        # There's room for 64 stamps, but most savefiles won't have anywhere
+        # near that many, so the Stamp objects themselves are only created
+        # once something actually asks for them.  (In debug mode we'll just
+        # create them all right away, so their offsets get reported.)
+        self._stamps_start = self.cursor.position - self.offset
+        self._stamps = [None]*Stamps.MAX_STAMPS
+        if is_debug():
+            for idx in range(Stamps.MAX_STAMPS):
+                self._get_stamp(idx)
+        self.cursor.position = self.offset + self._stamps_start + Stamps.MAX_STAMPS*Stamp.TOTAL_BYTES
+
+    def _get_stamp(self, index):
+        """
+        Returns the Stamp at the given `index`, creating it if need be.  This
+        doesn't do any bounds checking against the number of active stamps.
+        """
+        stamp = self._stamps[index]
+        if stamp is None:
+            stamp = Stamp(f'Stamp {index}', self,
+                    offset=self._stamps_start + index*Stamp.TOTAL_BYTES)
+            self._stamps[index] = stamp
+        return stamp
 
     def __len__(self):
         """
@@ -892,9 +979,11 @@ class Stamps(Data):
 
     def __iter__(self):
         """
-        Support iterating over our existing stamps
+        Support iterating over our existing stamps.  As with `clear`, this is
+        clamped to MAX_STAMPS in case the stamp count is bogus.
         """
-        return iter(self._stamps[:self._num_stamps.value])
+        for idx in range(min(self._num_stamps.value, Stamps.MAX_STAMPS)):
+            yield self._get_stamp(idx)
 
     def __getitem__(self, index):
         """
@@ -906,7 +995,7 @@ class Stamps(Data):
         if index >= self._num_stamps.value:
             # Just copying the stock Python error text for this
             raise IndexError('list index out of range')
-        return self._stamps[index]
+        return self._get_stamp(index)
 
     def __delitem__(self, index):
         """
@@ -921,27 +1010,38 @@ class Stamps(Data):
             # Just copying the stock Python error text for this
             raise IndexError('list assignment index out of range')
         self._num_stamps.value -= 1
+        last_stamp = self._get_stamp(self._num_stamps.value)
         if index < self._num_stamps.value:
-            self._stamps[index].copy_from(self._stamps[self._num_stamps.value])
-        self._stamps[self._num_stamps.value].clear()
+            self._get_stamp(index).copy_from(last_stamp)
+        last_stamp.clear()
 
     def append(self, x, y, icon):
         """
         Adds a Stamp to the end of the list.
         """
-        if self._num_stamps.value >= 64:
-            raise IndexError('maximum number of stamps is 64')
-        self._stamps[self._num_stamps.value].x.value = x
-        self._stamps[self._num_stamps.value].y.value = y
-        self._stamps[self._num_stamps.value].icon.value = icon
+        if self._num_stamps.value >= Stamps.MAX_STAMPS:
+            raise IndexError(f'maximum number of stamps is {Stamps.MAX_STAMPS}')
+        stamp = self._get_stamp(self._num_stamps.value)
+        stamp.x.value = x
+        stamp.y.value = y
+        stamp.icon.value = icon
         self._num_stamps.value += 1
 
     def clear(self):
         """
-        Completely removes all Stamps from the minimap
-        """
-        for stamp in self:
-            stamp.clear()
+        Completely removes all Stamps from the minimap.  Rather than clearing
+        each stamp field-by-field, we zero out the whole lot in the buffer at
+        once, and then just have any Stamp objects we've handed out re-read
+        their data.  The count is clamped to MAX_STAMPS, so a bogus stamp
+        count can't have us zeroing out whatever follows the stamp data.
+        """
+        num_stamps = min(self._num_stamps.value, Stamps.MAX_STAMPS)
+        start = self.offset + self._stamps_start
+        end = start + num_stamps*Stamp.TOTAL_BYTES
+        self.buf[start:end] = bytes(end-start)
+        for stamp in self._stamps[:num_stamps]:
+            if stamp is not None:
+                stamp.reload()
         self._num_stamps.value = 0
 
 
@@ -1022,6 +1122,8 @@ class Mural(Data):
             b'\xbe\xef\x43\x55\x55\x15\x00\xff\xe6\xee' + \
             b'\xfb\xbe\x0f\x00\x00\x00\xfc\xbf\xbb\xbb'
 
+    DATA_CLEAR = b'\x00'*TOTAL_BYTES
+
     COLORS = {
             # black
             (0x0A, 0x14, 0x32): 0,
@@ -1038,7 +1140,15 @@ class Mural(Data):
 
         # Subsequent data might rely on us having seeked to the end of the
         # data, so do so now.
-        self.df.seek(Mural.TOTAL_BYTES, os.SEEK_CUR)
+        self.cursor.position += Mural.TOTAL_BYTES
+
+    def _write_data(self, data):
+        """
+        Writes the specified raw data straight into the mural, without any
+        checks.  Only used directly for our own DATA_* constants, which we
+        know are the right length.
+        """
+        self.buf[self.offset:self.offset+Mural.TOTAL_BYTES] = data
 
     def _fill_with_data(self, data):
         """
@@ -1046,21 +1156,19 @@ class Mural(Data):
         """
         if len(data) != Mural.TOTAL_BYTES:
             raise RuntimeError(f'mural data bytes must be {Mural.TOTAL_BYTES} long')
-        self.df.seek(self.offset)
-        self.df.write(data)
+        self._write_data(data)
 
     def to_default(self):
-        self._fill_with_data(Mural.DATA_DEFAULT)
+        self._write_data(Mural.DATA_DEFAULT)
 
     def to_solved(self):
-        self._fill_with_data(Mural.DATA_SOLVED)
+        self._write_data(Mural.DATA_SOLVED)
 
     def clear(self):
         """
         Clears out the mural entirely
         """
-        data = b'\x00'*Mural.TOTAL_BYTES
-        self._fill_with_data(data)
+        self._write_data(Mural.DATA_CLEAR)
 
     def print_binary_data(self):
         """
@@ -1068,8 +1176,7 @@ class Mural(Data):
         script (as with the DATA_* vars, above).  The last line will require
         trimming off the "+ \" at the end.
         """
-        self.df.seek(self.offset)
-        data = self.df.read(Mural.TOTAL_BYTES)
+        data = self.buf[self.offset:self.offset+Mural.TOTAL_BYTES].tobytes()
         interval = 10
         s = 0
         while s < len(data):
@@ -1095,9 +1202,7 @@ class Mural(Data):
         Exports our raw data into `filename`.
         """
         with open(filename, 'wb') as odf:
-            self.df.seek(self.offset)
-            data = self.df.read(Mural.TOTAL_BYTES)
-            odf.write(data)
+            odf.write(self.buf[self.offset:self.offset+Mural.TOTAL_BYTES])
 
     def import_image(self, filename):
         """
@@ -1153,7 +1258,7 @@ class Mural(Data):
         # Now do the import.
         # TODO: This is probably the least-efficient and terrible way to do
         # this.  Adapted from the similarly-terrible pencil image export code.
-        self.df.seek(self.offset)
+        position = self.offset
         for y in range(im.height):
             x = 0
             for x0 in range(int(im.width/4)):
@@ -1165,7 +1270,8 @@ class Mural(Data):
                     byte <<= 2
                     byte |= color_translate.get(pixel, pixel)
                 x += 4
-                self.df.write(struct.pack('<B', byte))
+                self.buf[position] = byte
+                position += 1
 
 
     def export_image(self, filename):
@@ -1180,8 +1286,7 @@ class Mural(Data):
             raise RuntimeError('Pillow module does not seem to be available; export_png is not usable')
 
         # Collect the image data in the form that Pillow wants
-        self.df.seek(self.offset)
-        raw_data = self.df.read(Mural.TOTAL_BYTES)
+        raw_data = self.buf[self.offset:self.offset+Mural.TOTAL_BYTES]
         new_data = []
         for byte in raw_data:
             for _ in range(4):
@@ -1346,13 +1451,11 @@ class FillLevels(Data):
 
     def __init__(self, debug_label, parent, offset=None):
         super().__init__(debug_label, parent, offset=offset)
-        self.levels = []
-        for idx in range(FillLevels.NUM_RESERVOIRS):
-            self.levels.append(NumData(f'Reservoir {idx}', self, UInt8))
+        self.levels = NumData.bulk_read('Reservoir', self, UInt8, FillLevels.NUM_RESERVOIRS)
 
         # Fudge our location so that a data value that comes after is at
         # the correct spot without needing to specify an absolute pos
-        self.df.seek(16-FillLevels.NUM_RESERVOIRS, os.SEEK_CUR)
+        self.cursor.position += 16-FillLevels.NUM_RESERVOIRS
 
     def __iter__(self):
         return iter(self.levels)
@@ -1398,6 +1501,11 @@ class TileID(Data):
     doing things properly.
     """
 
+    __slots__ = ('room_y', 'room_x', 'tile_y', 'tile_x')
+
+    # Total size of a single TileID (four UInt8s)
+    TOTAL_BYTES = 4
+
     def __init__(self, debug_label, parent, offset=None):
         super().__init__(debug_label, parent, offset=offset)
 
@@ -1420,6 +1528,15 @@ class TileID(Data):
         self.tile_y.value = 0
         self.tile_x.value = 0
 
+    def reload(self):
+        """
+        Re-reads our data from the buffer, after it's been altered directly.
+        """
+        self.room_y.reload()
+        self.room_x.reload()
+        self.tile_y.reload()
+        self.tile_x.reload()
+
     def to_tuple(self):
         """
         Returns ourself as a tuple which can be compared to the entries in
@@ -1484,9 +1601,28 @@ class TileIDs(Data):
         else:
             self.invalid = invalid
         self._next_index = None
-        self._tiles = []
-        for idx in range(num_entries):
-            self._tiles.append(TileID(f'Tile {idx}', self))
+
+        # As with Stamps, most of these entries will never get looked at, so
+        # the TileID objects are only created as they're needed.  (Again, in
+        # debug mode we'll create them all up front so their offsets get
+        # reported.)
+        self._tiles_start = self.cursor.position - self.offset
+        self._tiles = [None]*num_entries
+        if is_debug():
+            for idx in range(num_entries):
+                self._get_tile(idx)
+        self.cursor.position = self.offset + self._tiles_start + num_entries*TileID.TOTAL_BYTES
+
+    def _get_tile(self, index):
+        """
+        Returns the TileID at the given `index`, creating it if need be.
+        """
+        tile = self._tiles[index]
+        if tile is None:
+            tile = TileID(f'Tile {index}', self,
+                    offset=self._tiles_start + index*TileID.TOTAL_BYTES)
+            self._tiles[index] = tile
+        return tile
 
     def __len__(self):
         """
@@ -1501,7 +1637,8 @@ class TileIDs(Data):
         """
         Allow iteration over our stored tiles
         """
-        return iter(self._tiles[:len(self)])
+        for idx in range(len(self)):
+            yield self._get_tile(idx)
 
     def populate_index(self, parent, offset=None):
         """
@@ -1522,11 +1659,18 @@ class TileIDs(Data):
 
     def clear(self):
         """
-        Clears out all tiles from ourselves
+        Clears out all tiles from ourselves.  As with `Stamps.clear`, we zero
+        out the whole lot in the buffer at once (rather than creating every
+        TileID just to clear it), and then have any TileIDs we've already
+        handed out re-read their data.
         """
         self._next_index.value = 0
+        start = self.offset + self._tiles_start
+        end = start + self._num_entries*TileID.TOTAL_BYTES
+        self.buf[start:end] = bytes(end-start)
         for tile in self._tiles:
-            tile.clear()
+            if tile is not None:
+                tile.reload()
 
     def fill(self):
         """
@@ -1538,7 +1682,7 @@ class TileIDs(Data):
         if self._next_index + len(values_to_add) > self._num_entries:
             raise RuntimeError(f'Attempting to add {len(values_to_add)} entries to the existing {self._next_index} would overflow this structure (max size: {self._num_entries})')
         for tile_values in sorted(values_to_add):
-            self._tiles[self._next_index.value].from_tuple(tile_values)
+            self._get_tile(self._next_index.value).from_tuple(tile_values)
             self._next_index.value += 1
 
     def remove_invalid(self):
@@ -1552,9 +1696,10 @@ class TileIDs(Data):
                 to_remove.append(idx)
         for index in reversed(to_remove):
             self._next_index.value -= 1
+            last_tile = self._get_tile(self._next_index.value)
             if index < self._next_index.value:
-                self._tiles[index].copy_from(self._tiles[self._next_index.value])
-            self._tiles[self._next_index.value].clear()
+                self._get_tile(index).copy_from(last_tile)
+            last_tile.clear()
 
 
 class Cranks(Data):
@@ -1566,9 +1711,7 @@ class Cranks(Data):
 
     def __init__(self, debug_label, parent, offset=None):
         super().__init__(debug_label, parent, offset=offset)
-        self._cranks = []
-        for idx in range(23):
-            self._cranks.append(NumData(f'Crank {idx}', self, UInt16))
+        self._cranks = NumData.bulk_read('Crank', self, UInt16, 23)
 
     def __iter__(self):
         return iter(self._cranks)
@@ -1643,7 +1786,7 @@ class BigStalactites(Data):
             self.stalactites.append(NumChoiceData(BigStalactites.LABELS[idx], self, UInt8, BigStalactiteState))
         # The structure is apparently 16 long, even though we only have 14.  Seek
         # to the end just in case any other data is chained afterwards.
-        self.df.seek(16-len(self), os.SEEK_CUR)
+        self.cursor.position += 16-len(self)
 
     def __len__(self):
         """
@@ -1714,29 +1857,129 @@ class Slot(Data):
     stored.
     """
 
+    __slots__ = (
+            'savegame', 'index', 'has_data', '_data_loaded',
+            'timestamp', 'cranks', 'locked_doors', 'moved_walls', 'num_steps',
+            'fill_levels', 'chests_opened', 'button_doors_opened',
+            'yellow_buttons_pressed', 'purple_buttons_pressed',
+            'green_buttons_pressed', 'picked_fruit', 'picked_firecrackers',
+            'eggs', 'walls_blasted', 'detonators_triggered', 'bunnies',
+            'illegal_bunnies', 'squirrels_scared', 'cat_status',
+            'firecrackers_collected', 'bubbles_popped', 'num_saves',
+            'pink_buttons_pressed', 'invalid_pink_buttons', 'nuts',
+            'layer1_chests_opened', 'layer2_buttons_pressed', 'keys', 'matches',
+            'firecrackers', 'health', 'gold_hearts', 'last_groundhog_year',
+            'egg_doors', 'elapsed_ticks_ingame', 'elapsed_ticks_withpause',
+            'spawn_room', 'equipment', 'inventory', 'candles', 'num_hits',
+            'num_deaths', 'ghosts_scared', 'selected_equipment', 'quest_state',
+            'blue_manticore', 'red_manticore', 'kangaroo_state', 'progress',
+            'flames', 'teleports_seen', 'teleports', 'stamps', 'elevators',
+            'mural_coords', 'minimap', 'pencilmap', 'destructionmap', 'mural',
+            'big_stalactites', 'deposit_small_broken', 'icicles_broken',
+            'berries_eaten_while_full',
+            )
+
     TOTAL_BYTES = 159_760
 
+    # Fields which only get set up when something actually asks for them,
+    # along with their classes, labels, and offsets.  These all need explicit
+    # offsets (as does whatever follows them in `_parse_data`), since they
+    # won't be there to advance the cursor while parsing.  The last item is
+    # the number of unknown bytes between the end of the previous field and
+    # this one, which debug mode uses to make sure that these offsets still
+    # line up with the rest of `_parse_data`.
+    LAZY_FIELDS = {
+            'elapsed_ticks_ingame': (Ticks, 'Ingame Ticks', 0x1BC, 2),
+            'elapsed_ticks_withpause': (Ticks, 'Total Ticks', 0x1C0, 0),
+            'spawn_room': (MapCoord, 'Spawn', 0x1D4, 0x10),
+            'minimap': (Minimap, 'Minimap Revealed', 0x3EC, 0),
+            'pencilmap': (Minimap, 'Minimap Pencil Layer', 0xD22D, 1),
+            'destructionmap': (Minimap, 'Destroyed Blocks', 0x1A06E, 1),
+            }
+
+    # Everything else which `_parse_data` sets up.  For empty slots these
+    # won't exist until something asks for one of them, at which point we
+    # parse the rest of the slot.
+    DATA_FIELDS = frozenset(__slots__).difference(
+            ('savegame', 'index', 'has_data', '_data_loaded', 'timestamp'),
+            LAZY_FIELDS,
+            )
+
     def __init__(self, debug_label, parent, index, offset):
         super().__init__(debug_label, parent, offset=offset)
         self.savegame = self.parent
         self.index = index
-        self.df = self.savegame.df
         self.has_data = False
+        self._data_loaded = False
 
         # Actually load in all the data
         self._parse()
 
+    def __getattr__(self, name):
+        """
+        Only called when normal attribute lookup fails.  Anything in
+        `LAZY_FIELDS` is created the first time it's asked for.  Also, for
+        empty slots we hold off on parsing anything past the timestamp, so if
+        something asks for one of those fields (see `DATA_FIELDS`), parse the
+        rest of the slot now.  Anything else is just an unknown attribute.
+        """
+        if name in Slot.LAZY_FIELDS:
+            field_class, label, offset, _ = Slot.LAZY_FIELDS[name]
+            field = field_class(label, self, offset)
+            setattr(self, name, field)
+            return field
+        if name in Slot.DATA_FIELDS and not self._data_loaded:
+            self._parse_data()
+            return getattr(self, name)
+        raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+
     def _parse(self):
         """
-        Parses our slot structure
+        Parses our slot structure.  If the slot is empty, we'll only read in
+        the timestamp and wait until something actually asks for the rest of
+        the data before parsing it (there's no point building up a few hundred
+        objects to look at a big block of zeroes).  Debug mode, and slots
+        whose data we've already parsed once, will always get everything.
         """
-        self.df.seek(self.offset)
+        self.cursor.position = self.offset
 
         self.timestamp = Timestamp('Timestamp', self)
         # If the timestamp is all zeroes, assume that the slot is empty
-        # (though we'll continue to load the rest of the data anyway)
         self.has_data = self.timestamp.has_data
 
+        if self.has_data or self._data_loaded or is_debug():
+            self._parse_data()
+
+    def _debug_lazy_fields(self, *names):
+        """
+        When in debug mode, sets up the specified lazy fields right away, so
+        that their offsets get reported in the right spot.  We'll also
+        complain if a field's offset in `LAZY_FIELDS` doesn't match up with
+        where the parse would have put it.
+        """
+        if is_debug():
+            for name in names:
+                field_class, label, offset, gap = Slot.LAZY_FIELDS[name]
+                expected = self.cursor.position - self.offset + gap
+                if offset != expected:
+                    raise RuntimeError(f'Lazy field {name} is at 0x{offset:X} but parsing expected it at 0x{expected:X}')
+                getattr(self, name)
+
+    def _parse_data(self):
+        """
+        Parses everything in our slot structure past the timestamp
+        """
+        self._data_loaded = True
+        self.cursor.position = self.timestamp.offset + Timestamp.TOTAL_BYTES
+
+        # If we're re-parsing, get rid of any lazy fields we'd already set up,
+        # since they might be holding on to old values.
+        for name in Slot.LAZY_FIELDS:
+            try:
+                delattr(self, name)
+            except AttributeError:
+                pass
+
         self.cranks = Cranks('Cranks', self, 0x8)
 
         self.locked_doors = TileIDs('Locked Doors', self, 16, {
@@ -1813,10 +2056,11 @@ class Slot(Data):
         self.moved_walls.populate_index(self)
         self.egg_doors = NumBitfieldData('Egg Doors', self, UInt8, EggDoor)
 
-        self.elapsed_ticks_ingame = Ticks('Ingame Ticks', self, 0x1BC)
-        self.elapsed_ticks_withpause = Ticks('Total Ticks', self)
-
-        self.spawn_room = MapCoord('Spawn', self, 0x1D4)
+        # `elapsed_ticks_ingame`, `elapsed_ticks_withpause`, and `spawn_room`
+        # are created by `__getattr__` on first access (see `LAZY_FIELDS`).
+        # In debug mode we'll set them up right away so their offsets get
+        # reported.
+        self._debug_lazy_fields('elapsed_ticks_ingame', 'elapsed_ticks_withpause', 'spawn_room')
 
         self.equipment = NumBitfieldData('Equipment', self, UInt16, Equipment, 0x1DC)
         self.inventory = NumBitfieldData('Inventory', self, UInt8, Inventory)
@@ -1842,11 +2086,10 @@ class Slot(Data):
         self.stamps = Stamps('Minimap Stamps', self)
         self.elevators = Elevators('Elevators', self)
         self.mural_coords = MuralCoord('Mural Coordinates', self)
-        self.minimap = Minimap('Minimap Revealed', self)
 
-        self.pencilmap = Minimap('Minimap Pencil Layer', self, 0xD22D)
-
-        self.destructionmap = Minimap('Destroyed Blocks', self, 0x1A06E)
+        # Likewise the minimap layers, which take up a big chunk of the slot
+        # but often aren't needed at all.
+        self._debug_lazy_fields('minimap', 'pencilmap', 'destructionmap')
 
         self.mural = Mural('Bunny Mural', self, 0x26EAF)
         self.big_stalactites = BigStalactites('Big Stalactites', self)
@@ -1860,8 +2103,7 @@ class Slot(Data):
         """
         Reads in all current slot data as a single bytestring
         """
-        self.df.seek(self.offset)
-        return self.df.read(Slot.TOTAL_BYTES)
+        return self.buf[self.offset:self.offset+Slot.TOTAL_BYTES].tobytes()
 
     def import_data(self, data):
         """
@@ -1869,8 +2111,7 @@ class Slot(Data):
         """
         if len(data) != Slot.TOTAL_BYTES:
             raise RuntimeError(f'imported slot data must be exactly {Slot.TOTAL_BYTES} bytes')
-        self.df.seek(self.offset)
-        self.df.write(data)
+        self.buf[self.offset:self.offset+Slot.TOTAL_BYTES] = data
         self._parse()
 
 
@@ -1891,8 +2132,11 @@ class Savegame():
     def __init__(self, filename, autosave=False):
         """
         Load in an existing savegame from the file `filename`.  We will load
-        the savegame into an in-memory `io.BytesIO` object and operate on
-        that while viewing/editing.
+        the savegame into an in-memory buffer and operate on that while
+        viewing/editing.  The buffer is an anonymous `mmap.mmap`, which acts
+        like a file but also lets us unpack/pack data directly at a given
+        offset.  (It's deliberately *not* mapped to the file itself -- we
+        don't want changes hitting the disk until `save()` is called.)
 
         The `autosave` boolean is used when this object is used as a context
         manager (ie: `with Savegame(foo, autosave=True) as save:`).  When
@@ -1906,7 +2150,16 @@ class Savegame():
         self.autosave = autosave
         self.offset = 0
         with open(self.filename, 'rb') as read_df:
-            self.df = io.BytesIO(read_df.read())
+            # Read straight into our buffer, rather than reading into a bytes
+            # object first and then copying that over.
+            size = os.fstat(read_df.fileno()).st_size
+            if size == 0:
+                raise RuntimeError(f'Savefile is empty: {self.filename}')
+            self.df = mmap.mmap(-1, size)
+            self.buf = memoryview(self.df)
+            if read_df.readinto(self.buf) != size:
+                raise RuntimeError(f'Could not read all of savefile: {self.filename}')
+        self.cursor = Cursor()
 
         # Pretend to be a Data object
         self.parent = None
@@ -1934,7 +2187,7 @@ class Savegame():
         Reads in the initial savegame; only really intended to be used once during
         the constructor, but I wanted this in its own function anyway
         """
-        self.df.seek(self.offset)
+        self.cursor.position = self.offset
         self.version = NumData('Save Version', self, UInt32)
         if self.version.value != 9:
             raise RuntimeError(f'Unknown savefile version: {self.version}')
@@ -1951,28 +2204,64 @@ class Savegame():
                 Slot('Slot 3', self, 2, 0x4E038),
                 ]
 
-    def save(self, force_invalid_checksum=False, force_checksum=None):
+    def compute_checksum(self):
+        """
+        Computes what our checksum *should* be, given the current data.  The
+        checksum is just every byte in the file XORed together (apart from
+        the checksum byte itself).
+
+        Rather than looping over every byte in Python (which is half a million
+        iterations), we read the whole buffer in as one giant integer and then
+        keep XORing its top half onto its bottom half until there's only a
+        single byte left.  The split is always on a byte boundary, so every
+        byte ends up XORed into the result exactly once, and it only takes a
+        couple dozen bigint operations.  (That turns out to be quite a bit
+        quicker than `functools.reduce()`ing over 8-byte words, too.)
+
+        The very first fold is done by converting each half of the buffer to
+        an integer separately, which saves us from having to shift and mask
+        the largest integer of the lot.  Once we're down to a single 64-bit
+        word, the last few folds are just plain shifts.
+        """
+        num_bytes = len(self.buf)//2
+        total = int.from_bytes(self.buf[:num_bytes], 'little') \
+                ^ int.from_bytes(self.buf[num_bytes:num_bytes*2], 'little')
+        if len(self.buf) % 2:
+            total ^= self.buf[-1]
+        while num_bytes > 8:
+            half_bits = ((num_bytes+1)//2)*8
+            total = (total >> half_bits) ^ (total & ((1 << half_bits)-1))
+            num_bytes = half_bits//8
+        total ^= total >> 32
+        total ^= total >> 16
+        total ^= total >> 8
+        total &= 0xFF
+
+        # The stored checksum was included in that, so XOR it back out (rather
+        # than having to zero it out in the data beforehand).
+        return total ^ self.checksum.value
+
+    def save(self, force_invalid_checksum=False, force_checksum=None, atomic=False):
         """
         Saves any changes out to disk.  This will automatically recompute the
         checksum and change it if needed.  To force writing of an invalid
         checksum, pass `force_invalid_checksum=True` (perhaps you *want* a
         Manticore friend to follow you around?).  To force a specific
         checksum for whatever reason, pass it in with `force_checksum`.
+
+        By default the savegame is overwritten in place.  Pass `atomic=True`
+        to instead write to a temp file alongside it and then swap that into
+        place, so a crash partway through can't leave a truncated savegame
+        behind.  Note that the swapped-in file is a brand new file, though:
+        only its permission bits are carried over, so owner, group, ACLs,
+        extended attributes and hardlinks to the original are all lost.  If
+        the swap itself fails (on Windows, for instance, while the game or
+        Steam Cloud has the file open), we fall back to an in-place write.
         """
         
         # First, deal with our checksum.
         if force_checksum is None:
-            # Compute the checksum -- clear it out first (to zero), which means
-            # we don't have to bother skipping the byte while doing the XORs.
-            # This feels awfully inefficient (`read()`ing the whole file contents
-            # again, even though it's already in memory) but I kept running into
-            # weird issues when trying to use getbuffer() to operate on the whole
-            # byte buffer as-is.
-            self.checksum.value = 0
-            self.df.seek(0)
-            total = 0
-            for byte in self.df.read():
-                total ^= byte
+            total = self.compute_checksum()
             # If we've been told to write an invalid checksum, invert all our
             # bits after the computation.
             if force_invalid_checksum:
@@ -1981,8 +2270,48 @@ class Savegame():
         else:
             self.checksum.value = force_checksum
 
-        # Now write out
-        self.df.seek(0)
+        # Now write out.  Handing over our memoryview means the data goes
+        # straight from our buffer to the file, without an intermediate copy.
+        if atomic and self._save_atomic():
+            return
         with open(self.filename, 'wb') as write_df:
-            write_df.write(self.df.read())
+            write_df.write(self.buf)
+
+    def _save_atomic(self):
+        """
+        Writes our data out to a temp file next to our savegame and then
+        swaps it into place with `os.replace()`.  Symlinks are resolved first
+        so that it's the link's target which gets replaced, rather than the
+        link itself.  Returns `True` if the savegame was replaced, or `False`
+        if the swap couldn't be done (in which case the temp file is cleaned
+        up and the caller should write in place instead).
+        """
+        target_filename = os.path.realpath(self.filename)
+        try:
+            temp_fd, temp_filename = tempfile.mkstemp(
+                    dir=os.path.dirname(target_filename),
+                    prefix=f'.{os.path.basename(target_filename)}.',
+                    suffix='.tmp',
+                    )
+        except OSError:
+            return False
+        replaced = False
+        try:
+            with os.fdopen(temp_fd, 'wb') as write_df:
+                write_df.write(self.buf)
+                write_df.flush()
+                os.fsync(write_df.fileno())
+            if os.path.exists(target_filename):
+                shutil.copymode(target_filename, temp_filename)
+            os.replace(temp_filename, target_filename)
+            replaced = True
+        except OSError:
+            pass
+        finally:
+            if not replaced:
+                try:
+                    os.unlink(temp_filename)
+                except OSError:
+                    pass
+        return replaced
 